@@ -1,6 +1,58 @@
 # ruff: noqa: F401
-from pytorjoman.accounts import Account
-from pytorjoman.projects import Project
-from pytorjoman.sections import Section
-from pytorjoman.sentences import Sentence
-from pytorjoman.translations import Translation
+import importlib
+from typing import TYPE_CHECKING
+
+# names are imported on first access so that `import pytorjoman`, and the
+# command line tool, don't pay for httpx and every model module up front
+_ATTRIBUTES = {
+    "aclose": "pytorjoman._backend",
+    "configure": "pytorjoman._backend",
+    "priority": "pytorjoman._backend",
+    "stats": "pytorjoman._backend",
+    "Account": "pytorjoman.accounts",
+    "Project": "pytorjoman.projects",
+    "Section": "pytorjoman.sections",
+    "Sentence": "pytorjoman.sentences",
+    "Translation": "pytorjoman.translations",
+}
+_SUBMODULES = {
+    "accounts",
+    "cli",
+    "crawl",
+    "errors",
+    "imports",
+    "journal",
+    "profiling",
+    "projects",
+    "search",
+    "sections",
+    "sentences",
+    "snapshots",
+    "sync",
+    "translations",
+    "validation",
+}
+__all__ = [*_ATTRIBUTES]
+
+if TYPE_CHECKING:
+    from pytorjoman._backend import aclose, configure, priority, stats
+    from pytorjoman.accounts import Account
+    from pytorjoman.projects import Project
+    from pytorjoman.sections import Section
+    from pytorjoman.sentences import Sentence
+    from pytorjoman.translations import Translation
+
+
+def __getattr__(name: str):
+    if name in _ATTRIBUTES:
+        value = getattr(importlib.import_module(_ATTRIBUTES[name]), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f"pytorjoman.{name}")
+    else:
+        raise AttributeError(f"module 'pytorjoman' has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_ATTRIBUTES) | _SUBMODULES)
@@ -0,0 +1,3 @@
+from pytorjoman.cli import main
+
+main()
@@ -1,7 +1,485 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Optional
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Optional,
+    TypeVar,
+)
 
-import httpx
+if TYPE_CHECKING:
+    import httpx
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+_config = {
+    "max_connections": 20,
+    "weights": {"interactive": 8, "bulk": 1},
+    "transport": None,
+    "replicas": {},
+    "adaptive": False,
+}
+_priority: ContextVar[str] = ContextVar("pytorjoman_priority", default="interactive")
+# objects with a `record` method, see pytorjoman.profiling
+_recorders: ContextVar[tuple] = ContextVar("pytorjoman_recorders", default=())
+# replica that served a writer's last mutation of a replicated base url, and
+# until when the writer's reads stick to it, keyed by (base url, token) and
+# shared by every event loop and thread of the process, oldest first
+_pins: dict[tuple[str, Optional[str]], tuple[str, float]] = {}
+_pins_lock = threading.Lock()
+
+
+def configure(
+    max_connections: int | None = None,
+    weights: dict[str, float] | None = None,
+    transport: "httpx.AsyncBaseTransport | None" = None,
+    replicas: dict[str, list[str]] | None = None,
+    adaptive: bool | None = None,
+) -> None:
+    """Tune the shared transport.
+
+    `max_connections` bounds the requests in flight per event loop, `weights`
+    maps priority classes to their share of it. `transport` replaces httpx's
+    network transport, e.g. with an `httpx.MockTransport` stand-in server.
+    `replicas` maps a base url, as given to the models, to the replicas
+    serving it, see `_Balancer`. With `adaptive` the number of requests in
+    flight follows the observed latency instead of staying at
+    `max_connections`, which becomes its upper bound, see `_AdaptiveLimiter`.
+    Affects transports created after the call, i.e. event loops that haven't
+    made a request yet.
+    """
+    if max_connections is not None:
+        _config["max_connections"] = max_connections
+    if weights is not None:
+        _config["weights"] = weights
+    if transport is not None:
+        _config["transport"] = transport
+    if replicas is not None:
+        _config["replicas"] = {
+            base.rstrip("/"): [url.rstrip("/") for url in urls]
+            for base, urls in replicas.items()
+        }
+    if adaptive is not None:
+        _config["adaptive"] = adaptive
+
+
+@contextmanager
+def priority(name: str):
+    """Run the requests made inside the block, and tasks it spawns, as `name`.
+
+    Requests default to "interactive", bulk jobs should use "bulk" so they
+    don't starve interactive calls.
+    """
+    token = _priority.set(name)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class _AdaptiveLimiter:
+    """Concurrency limit driven by latency, in the style of TCP Vegas.
+
+    Compares a smoothed round trip time to the lowest one seen over the last
+    `window` seconds, so a server that got permanently slower becomes the
+    new baseline. While the RTT stays within `tolerance` of that baseline
+    the limit grows by one per limit's worth of responses, but only when it
+    is actually used. When latency rises or a request fails (5xx, 429 or no
+    response) the limit is multiplied by `backoff`, at most once per RTT.
+    """
+
+    tolerance = 1.5
+    backoff = 0.9
+    smoothing = 0.2
+    window = 30.0
+
+    def __init__(self, maximum: int, minimum: int = 1, initial: int = 10):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(max(minimum, min(initial, maximum)))
+        self.rtt: Optional[float] = None
+        self.min_rtt: Optional[float] = None
+        self._window_min = float("inf")
+        self._window_start = time.monotonic()
+        self._last_decrease = 0.0
+
+    def observe(self, rtt: float, ok: bool, in_flight: int) -> None:
+        now = time.monotonic()
+        self._window_min = min(self._window_min, rtt)
+        if now - self._window_start >= self.window:
+            self.min_rtt = self._window_min
+            self._window_min = rtt
+            self._window_start = now
+        if self.rtt is None:
+            self.rtt = self.min_rtt = rtt
+        else:
+            self.rtt += self.smoothing * (rtt - self.rtt)
+            self.min_rtt = min(self.min_rtt, rtt)
+        if not ok or self.rtt > self.min_rtt * self.tolerance:
+            if now - self._last_decrease >= self.rtt:
+                self.limit = max(self.minimum, self.limit * self.backoff)
+                self._last_decrease = now
+        elif in_flight >= self.limit - 1:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+
+class _Scheduler:
+    """Weighted fair queueing of requests over a number of slots.
+
+    The number is fixed, or follows `limiter` when one is given.
+    """
+
+    def __init__(
+        self,
+        slots: int,
+        weights: dict[str, float],
+        limiter: Optional[_AdaptiveLimiter] = None,
+    ):
+        self._slots = slots
+        self.weights = weights
+        self.limiter = limiter
+        self.in_flight = 0
+        self._queue: list[tuple[float, int, asyncio.Future]] = []
+        self._finish: dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._counter = itertools.count()
+
+    @property
+    def slots(self) -> int:
+        return int(self.limiter.limit) if self.limiter else self._slots
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    async def acquire(self, priority: str) -> None:
+        if self.in_flight < self.slots and not self._queue:
+            self.in_flight += 1
+            return
+        tag = max(self._virtual_time, self._finish.get(priority, 0.0)) + 1 / (
+            self.weights.get(priority, 1)
+        )
+        self._finish[priority] = tag
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (tag, next(self._counter), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was handed over right before the cancellation
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self.admit()
+
+    def admit(self) -> None:
+        """Hand free slots to the queued requests with the lowest tags."""
+        while self._queue and self.in_flight < self.slots:
+            tag, _, waiter = heapq.heappop(self._queue)
+            if not waiter.done():
+                self.in_flight += 1
+                self._virtual_time = tag
+                waiter.set_result(None)
+
+    def observe(self, rtt: float, ok: bool) -> None:
+        if self.limiter is not None:
+            self.limiter.observe(rtt, ok, self.in_flight)
+            self.admit()
+
+
+class _Replica:
+    def __init__(self, url: str):
+        self.url = url
+        self.outstanding = 0
+        self.latency: Optional[float] = None
+        self.failures = 0
+        self.open = False
+
+
+class _Balancer:
+    """Route requests for one base url over its replicas.
+
+    Picks the replica with the lowest expected wait, outstanding requests
+    times its average latency. After `failure_threshold` consecutive
+    failures (connection errors or 5xx) a replica's circuit opens and it gets
+    no traffic until a background probe of `health_path` answers below 500.
+    For `affinity_seconds` after a mutation, reads made with the writer's
+    token stick to the replica that served it, so they see the write whatever
+    task, thread or `asyncio.run()` call makes them. Other tokens' requests,
+    and further writes, are balanced as usual. At most `max_pins` writers are
+    remembered.
+    """
+
+    failure_threshold = 5
+    probe_interval = 5.0
+    affinity_seconds = 10.0
+    max_pins = 10_000
+    health_path = "/"
+
+    def __init__(self, base: str, urls: list[str]):
+        self.base = base
+        self.replicas = {url: _Replica(url) for url in urls}
+        self._probes: set[asyncio.Task] = set()
+
+    def pinned(self, writer: Optional[str]) -> Optional[_Replica]:
+        """The replica that served `writer`'s last recent mutation, if usable."""
+        pin = _pins.get((self.base, writer))
+        if pin is None or pin[1] <= time.monotonic():
+            return None
+        replica = self.replicas.get(pin[0])
+        return replica if replica is not None and not replica.open else None
+
+    def pick(self, exclude: Optional[_Replica] = None) -> _Replica:
+        candidates = [
+            r for r in self.replicas.values() if not r.open and r is not exclude
+        ] or list(self.replicas.values())
+        known = [r.latency for r in candidates if r.latency is not None]
+        default = min(known) if known else 1.0
+        return min(
+            candidates,
+            key=lambda r: (r.outstanding + 1) * (r.latency or default),
+        )
+
+    def pin(self, writer: Optional[str], replica: _Replica) -> None:
+        now = time.monotonic()
+        with _pins_lock:
+            # moved to the end, keeping the entries in expiry order
+            _pins.pop((self.base, writer), None)
+            _pins[self.base, writer] = (replica.url, now + self.affinity_seconds)
+            while _pins:
+                oldest = next(iter(_pins))
+                if _pins[oldest][1] > now and len(_pins) <= self.max_pins:
+                    break
+                del _pins[oldest]
+
+    def succeeded(self, replica: _Replica, elapsed: float) -> None:
+        replica.failures = 0
+        replica.latency = (
+            elapsed
+            if replica.latency is None
+            else 0.8 * replica.latency + 0.2 * elapsed
+        )
+
+    def failed(self, replica: _Replica, client: "httpx.AsyncClient") -> None:
+        replica.failures += 1
+        if replica.failures >= self.failure_threshold and not replica.open:
+            replica.open = True
+            task = asyncio.create_task(self._probe(replica, client))
+            self._probes.add(task)
+            task.add_done_callback(self._probes.discard)
+
+    async def _probe(self, replica: _Replica, client: "httpx.AsyncClient") -> None:
+        while replica.open:
+            await asyncio.sleep(self.probe_interval)
+            try:
+                res = await client.get(f"{replica.url}{self.health_path}")
+            except Exception:
+                continue
+            if res.status_code < 500:
+                replica.failures = 0
+                replica.latency = None
+                replica.open = False
+
+
+def _record(
+    method: str,
+    url: str,
+    kwargs: dict,
+    status: int | str,
+    elapsed: float,
+    queued: float,
+) -> None:
+    for recorder in _recorders.get():
+        recorder.record(
+            method,
+            url,
+            kwargs.get("params", {}),
+            kwargs.get("json"),
+            status,
+            elapsed,
+            queued,
+        )
+
+
+class _Transport:
+    """Connection pool and request scheduler shared by an event loop's calls."""
+
+    def __init__(self):
+        # imported here to keep `import pytorjoman` fast
+        import httpx
+
+        self._errors = httpx.TransportError
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=_config["max_connections"],
+                max_keepalive_connections=_config["max_connections"],
+            ),
+            transport=_config["transport"],
+        )
+        self.scheduler = _Scheduler(
+            _config["max_connections"],
+            _config["weights"],
+            _AdaptiveLimiter(_config["max_connections"])
+            if _config["adaptive"]
+            else None,
+        )
+        self.balancers = {
+            base: _Balancer(base, urls) for base, urls in _config["replicas"].items()
+        }
+        # asyncio.run() finalizes the loop's async generators before closing
+        # it, this one closes the pool then, while the loop can still run it
+        self._shutdown = self._close_at_shutdown()
+        try:
+            self._shutdown.asend(None).send(None)
+        except StopIteration:
+            pass
+
+    async def _close_at_shutdown(self):
+        try:
+            yield
+        finally:
+            for balancer in self.balancers.values():
+                for probe in balancer._probes:
+                    probe.cancel()
+            await self.client.aclose()
+
+    async def aclose(self) -> None:
+        await self._shutdown.aclose()
+
+    def _balancer(self, url: str) -> tuple[Optional[_Balancer], str]:
+        for base, balancer in self.balancers.items():
+            # "http://api" must not match "http://apiserver/..."
+            if url.startswith(base) and url[len(base) : len(base) + 1] in "/?":
+                return balancer, url[len(base) :]
+        return None, url
+
+    async def request(
+        self, method: str, url: str, writer: Optional[str] = None, **kwargs
+    ) -> "httpx.Response":
+        """Send a request, `writer` identifies the caller for read affinity."""
+        queued = time.perf_counter()
+        await self.scheduler.acquire(_priority.get())
+        start = time.perf_counter()
+        try:
+            res = await self._route(method, url, writer, **kwargs)
+        except self._errors as e:
+            elapsed = time.perf_counter() - start
+            self.scheduler.observe(elapsed, False)
+            _record(method, url, kwargs, type(e).__name__, elapsed, start - queued)
+            raise
+        else:
+            elapsed = time.perf_counter() - start
+            self.scheduler.observe(
+                elapsed, res.status_code < 500 and res.status_code != 429
+            )
+            _record(method, url, kwargs, res.status_code, elapsed, start - queued)
+            return res
+        finally:
+            self.scheduler.release()
+
+    async def _route(
+        self, method: str, url: str, writer: Optional[str], **kwargs
+    ) -> "httpx.Response":
+        balancer, path = self._balancer(url)
+        if balancer is None:
+            return await self.client.request(method, url, **kwargs)
+        replica = balancer.pinned(writer) if method == "GET" else None
+        if replica is None:
+            replica = balancer.pick()
+        try:
+            res = await self._send(balancer, replica, method, path, **kwargs)
+        except self._errors:
+            if method != "GET" or len(balancer.replicas) == 1:
+                raise
+            # reads are safe to retry once on another replica
+            replica = balancer.pick(exclude=replica)
+            res = await self._send(balancer, replica, method, path, **kwargs)
+        if method != "GET" and res.status_code < 500:
+            balancer.pin(writer, replica)
+        return res
+
+    async def _send(
+        self, balancer: _Balancer, replica: _Replica, method: str, path: str, **kwargs
+    ) -> "httpx.Response":
+        replica.outstanding += 1
+        start = time.perf_counter()
+        try:
+            res = await self.client.request(method, f"{replica.url}{path}", **kwargs)
+        except self._errors:
+            balancer.failed(replica, self.client)
+            raise
+        finally:
+            replica.outstanding -= 1
+        if res.status_code >= 500:
+            balancer.failed(replica, self.client)
+        else:
+            balancer.succeeded(replica, time.perf_counter() - start)
+        return res
+
+
+_transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Transport]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _transport() -> _Transport:
+    loop = asyncio.get_running_loop()
+    if loop not in _transports:
+        # loops closed without finalizing their async generators, their pools
+        # hold the loop so the entries would never be collected otherwise
+        for closed in [other for other in _transports if other.is_closed()]:
+            del _transports[closed]
+        _transports[loop] = _Transport()
+    return _transports[loop]
+
+
+def stats(loop: Optional[asyncio.AbstractEventLoop] = None) -> Optional[dict]:
+    """Transport state of `loop`, the running event loop by default, for monitoring.
+
+    None when the loop has no transport yet, reading doesn't create one. Safe
+    to call from another thread, such as a monitoring one given the loop the
+    application runs on, `sync.stats()` reads the synchronous facade's loop.
+    """
+    transport = _transports.get(loop or asyncio.get_running_loop())
+    if transport is None:
+        return None
+    scheduler, limiter = transport.scheduler, transport.scheduler.limiter
+    return {
+        "limit": scheduler.slots,
+        "in_flight": scheduler.in_flight,
+        "queued": scheduler.queued,
+        "rtt": limiter.rtt if limiter else None,
+        "min_rtt": limiter.min_rtt if limiter else None,
+        "replicas": {
+            replica.url: {
+                "outstanding": replica.outstanding,
+                "latency": replica.latency,
+                "open": replica.open,
+            }
+            for balancer in transport.balancers.values()
+            for replica in balancer.replicas.values()
+        },
+    }
+
+
+async def aclose() -> None:
+    """Close the connection pool of the running event loop."""
+    transport = _transports.pop(asyncio.get_running_loop(), None)
+    if transport is not None:
+        await transport.aclose()
 
 
 async def _call(
@@ -20,15 +498,10 @@ async def _call(
         base["json"] = data
     if params:
         base["params"] = params
-    async with httpx.AsyncClient() as client:
-        match method:
-            case "POST":
-                res = await client.post(**base)
-            case "PUT":
-                res = await client.put(**base)
-            case "GET":
-                res = await client.get(**base)
-        return res.status_code, res.json()
+    # the token is passed even when not sent, so the reads an unauthenticated
+    # getter makes for a writer still see its writes
+    res = await _transport().request(method, writer=token, **base)
+    return res.status_code, res.json()
 
 
 @dataclass
@@ -61,3 +534,54 @@ class ModelList:
     next: Optional[int]
     previous: Optional[int]
     results: list[Model]
+
+
+async def _gather_bounded(
+    aws: Iterable[Awaitable[T]], limit: int, return_exceptions: bool = False
+) -> list[T]:
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(
+        *(run(aw) for aw in aws), return_exceptions=return_exceptions
+    )
+
+
+async def _all_pages(
+    fetch: Callable[[int, int], Awaitable[ModelList]],
+    page_size: int = 100,
+    concurrency: int = 8,
+    on_progress: Optional[Callable[[int], None]] = None,
+) -> list[Model]:
+    """Fetch every page of a paginated listing.
+
+    The first page is used to learn the total count, the remaining pages are
+    then requested concurrently. `on_progress` gets each page's item count.
+    """
+
+    async def fetch_page(page: int) -> ModelList:
+        result = await fetch(page, page_size)
+        if on_progress is not None:
+            on_progress(len(result.results))
+        return result
+
+    first = await fetch_page(1)
+    pages = -(-first.count // page_size)
+    rest = await _gather_bounded(
+        (fetch_page(page) for page in range(2, pages + 1)), concurrency
+    )
+    return first.results + [item for page in rest for item in page.results]
+
+
+async def _fetch_many(
+    keys: Iterable[K], fetch: Callable[[K], Awaitable[T]], concurrency: int
+) -> dict[K, T | Exception]:
+    """Fetch every distinct key once, failures are returned rather than raised."""
+    unique = list(dict.fromkeys(keys))
+    results = await _gather_bounded(
+        (fetch(key) for key in unique), concurrency, return_exceptions=True
+    )
+    return dict(zip(unique, results))
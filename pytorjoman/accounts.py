@@ -128,6 +128,15 @@ class Account(Model):
         )
         match status:
             case 200:
+                sections = await pytorjoman.Section._get_many(
+                    self.base_url,
+                    self._access_token,
+                    (s["section"] for s in res),
+                    concurrency=16,
+                )
+                for section in sections.values():
+                    if isinstance(section, Exception):
+                        raise section
                 return [
                     {
                         "sentence": pytorjoman.Sentence(
@@ -135,9 +144,7 @@ class Account(Model):
                             "sentences",
                             self._access_token,
                             s["id"],
-                            await pytorjoman.Section.get_section(
-                                self.base_url, self._access_token, s["section"]
-                            ),
+                            sections[s["section"]],
                             s["sentence"],
                             s["created_at"],
                         ),
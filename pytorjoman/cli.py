@@ -0,0 +1,441 @@
+"""Command line tool for bulk operations, installed as `pytorjoman`.
+
+Everything beyond argparse is imported inside the commands to keep startup
+fast for cron jobs, `pytorjoman bench-import` measures it.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+CACHE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "pytorjoman",
+    "token.json",
+)
+
+
+class Progress:
+    """Live requests/sec, items/sec and ETA on stderr."""
+
+    def __init__(self, total: int | None = None):
+        from pytorjoman.profiling import Profile
+
+        self.total = total
+        self.items = 0
+        self.profile = Profile()
+        self._start = time.monotonic()
+        self._task = None
+
+    def line(self) -> str:
+        elapsed = max(time.monotonic() - self._start, 1e-9)
+        items_rate = self.items / elapsed
+        line = (
+            f"{self.profile.total_requests / elapsed:8.1f} req/s"
+            f"  {items_rate:8.1f} items/s  {self.items}"
+        )
+        if self.total is not None:
+            line += f"/{self.total}"
+            if items_rate:
+                line += f"  ETA {(self.total - self.items) / items_rate:6.0f}s"
+        return line
+
+    def advance(self, items: int = 1) -> None:
+        self.items += items
+
+    async def _refresh(self):
+        import asyncio
+
+        while True:
+            print(f"\r{self.line()}", end="", file=sys.stderr, flush=True)
+            await asyncio.sleep(0.5)
+
+    def __enter__(self) -> "Progress":
+        import asyncio
+
+        self.profile.__enter__()
+        self._task = asyncio.get_running_loop().create_task(self._refresh())
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._task.cancel()
+        self.profile.__exit__(*exc)
+        print(f"\r{self.line()}", file=sys.stderr)
+
+
+def _save_account(account) -> None:
+    os.makedirs(os.path.dirname(CACHE), exist_ok=True)
+    fd = os.open(CACHE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(
+            {
+                "base_url": account.base_url,
+                "access": account._access_token,
+                "refresh": account._refresh_token,
+            },
+            f,
+        )
+
+
+async def _account():
+    from pytorjoman import Account
+    from pytorjoman.errors import TokenExpiredError
+
+    try:
+        with open(CACHE) as f:
+            cached = json.load(f)
+    except FileNotFoundError:
+        sys.exit("not logged in, run `pytorjoman login` first")
+    try:
+        account = await Account.login_from_token(cached["base_url"], cached["access"])
+    except TokenExpiredError:
+        account = Account(
+            cached["base_url"],
+            "accounts",
+            cached["access"],
+            0,
+            "",
+            "",
+            "",
+            "",
+            None,
+            0,
+            cached["refresh"],
+        )
+        await account.refresh_token()
+        account = await Account.login_from_token(
+            account.base_url, account._access_token
+        )
+    _save_account(account)
+    return account
+
+
+async def _section(section_id: int):
+    from pytorjoman import Section
+
+    account = await _account()
+    return await Section.get_section(
+        account.base_url, account._access_token, section_id
+    )
+
+
+def _read_lines(path: str) -> list[str]:
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+async def login(args):
+    import getpass
+
+    from pytorjoman import Account
+
+    password = args.password or getpass.getpass()
+    account = await Account.login(args.url.rstrip("/"), args.username, password)
+    _save_account(account)
+    print(f"logged in as {account.username}")
+
+
+async def projects(args):
+    account = await _account()
+    projects = await account.list_projects(args.page, args.page_size, not args.all)
+    for project in projects.results:
+        print(f"{project.id}\t{project.name}\t{project.owner.first_name}")
+    print(f"page {args.page} of {projects.count} projects", file=sys.stderr)
+
+
+async def sections(args):
+    from pytorjoman import Project
+
+    account = await _account()
+    project = await Project.get_project(
+        account.base_url, account._access_token, args.project
+    )
+    for section in await project.list_sections():
+        print(f"{section.id}\t{section.name}")
+
+
+async def import_(args):
+    from pytorjoman import priority
+    from pytorjoman._backend import _gather_bounded
+
+    section = await _section(args.section)
+    sentences = _read_lines(args.file)
+    with Progress(len(sentences)) as progress, priority("bulk"):
+
+        async def create(sentence):
+            try:
+                return await section.create_sentence(sentence)
+            finally:
+                progress.advance()
+
+        results = await _gather_bounded(
+            map(create, sentences), args.concurrency, return_exceptions=True
+        )
+    failed = [(s, r) for s, r in zip(sentences, results) if isinstance(r, Exception)]
+    for sentence, error in failed:
+        print(f"failed: {error!r}: {sentence}", file=sys.stderr)
+    print(f"created {len(sentences) - len(failed)} of {len(sentences)} sentences")
+
+
+async def import_translations(args):
+    from pytorjoman import Project
+    from pytorjoman.imports import import_translations, read_pairs
+
+    pairs = read_pairs(args.file)
+    if args.project:
+        account = await _account()
+        target = await Project.get_project(
+            account.base_url, account._access_token, args.target
+        )
+    else:
+        target = await _section(args.target)
+    with Progress(len(pairs)) as progress:
+        report = await import_translations(
+            target,
+            pairs,
+            args.fuzzy,
+            args.page_size,
+            args.concurrency,
+            progress.advance,
+        )
+    for source, translation in report.unmatched:
+        print(f"unmatched: {source}\t{translation}", file=sys.stderr)
+    for sentence, translation, error in report.failed:
+        print(f"failed: {error!r}: {sentence.id}\t{translation}", file=sys.stderr)
+    print(
+        f"{len(report.created)} created ({len(report.fuzzy)} fuzzy), "
+        f"{len(report.already_present)} already present, "
+        f"{len(report.unmatched)} unmatched, {len(report.failed)} failed"
+    )
+
+
+async def _snapshot(args):
+    from pytorjoman import Project
+
+    account = await _account()
+    project = await Project.get_project(
+        account.base_url, account._access_token, args.project
+    )
+    with Progress() as progress:
+        return await project.snapshot(
+            args.page_size, args.concurrency, progress.advance
+        )
+
+
+async def crawl(args):
+    snapshot = await _snapshot(args)
+    snapshot.save(args.output)
+    print(
+        f"saved {len(snapshot.sections)} sections, {len(snapshot.sentences)} "
+        f"sentences and {len(snapshot.translations)} translations to {args.output}"
+    )
+
+
+async def export(args):
+    from collections import defaultdict
+
+    snapshot = await _snapshot(args)
+    translations = defaultdict(list)
+    t = snapshot.translations
+    for row, sentence in enumerate(t["sentence"]):
+        translations[sentence].append(
+            {
+                "id": t["id"][row],
+                "translation": t.text[row],
+                "is_approved": bool(t["is_approved"][row]),
+            }
+        )
+    s = snapshot.sentences
+    with open(args.output, "w", encoding="utf-8") as f:
+        for row, sentence in enumerate(s["id"]):
+            record = {
+                "id": sentence,
+                "section": s["section"][row],
+                "sentence": s.text[row],
+                "translations": translations[sentence],
+            }
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    print(f"exported {len(s)} sentences to {args.output}")
+
+
+async def plan_crawl(args):
+    from pytorjoman import Project
+    from pytorjoman.crawl import CrawlCoordinator
+
+    account = await _account()
+    project = await Project.get_project(
+        account.base_url, account._access_token, args.project
+    )
+    coordinator = CrawlCoordinator(args.queue)
+    tasks = await coordinator.plan(project, args.page_size, args.concurrency)
+    print(f"queued {tasks} pages, progress: {coordinator.progress()}")
+    coordinator.close()
+
+
+async def _cached_account():
+    from pytorjoman import aclose
+
+    account = await _account()
+    await aclose()
+    return account.base_url, account._access_token
+
+
+def work(args):
+    import asyncio
+
+    from pytorjoman.crawl import CrawlCoordinator, run
+
+    base_url, token = asyncio.run(_cached_account())
+    start = time.monotonic()
+    run(args.queue, base_url, token, args.output, args.processes, args.concurrency)
+    coordinator = CrawlCoordinator(args.queue)
+    for section, page, attempts, error in coordinator.failures():
+        print(
+            f"failed: section {section} page {page}, {attempts} attempts: {error}",
+            file=sys.stderr,
+        )
+    print(f"{time.monotonic() - start:.1f}s, progress: {coordinator.progress()}")
+    coordinator.close()
+
+
+async def sync(args):
+    section = await _section(args.section)
+    sentences = _read_lines(args.file)
+    with Progress(len(sentences)) as progress:
+        report = await section.sync_from(
+            sentences, args.page_size, args.concurrency, progress.advance
+        )
+    for text, error in report.failed:
+        print(f"failed: {error!r}: {text}", file=sys.stderr)
+    print(
+        f"{report.unchanged} unchanged, {len(report.updated)} updated, "
+        f"{len(report.created)} created, {len(report.removed)} left over, "
+        f"{len(report.failed)} failed"
+    )
+
+
+def bench_import(args):
+    import statistics
+    import subprocess
+
+    def run(code: str) -> float:
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        return time.perf_counter() - start
+
+    baseline = statistics.median(run("pass") for _ in range(args.runs))
+    for module in ("pytorjoman", "pytorjoman.cli", "pytorjoman.sync"):
+        code = f"import {module}"
+        median = statistics.median(run(code) for _ in range(args.runs))
+        print(f"{(median - baseline) * 1000:8.1f} ms  {code}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="pytorjoman", description="Bulk operations on a Torjoman server."
+    )
+    parser.add_argument(
+        "--max-connections", type=int, help="requests in flight, 20 by default"
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="adapt requests in flight to the server's latency, up to the maximum",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("login", help="log in and cache the tokens")
+    command.add_argument("url", help="server base url")
+    command.add_argument("username")
+    command.add_argument("--password", help="prompted for when missing")
+    command.set_defaults(func=login)
+
+    command = commands.add_parser("projects", help="list projects")
+    command.add_argument("--all", action="store_true", help="not only yours")
+    command.add_argument("--page", type=int, default=1)
+    command.add_argument("--page-size", type=int, default=25)
+    command.set_defaults(func=projects)
+
+    command = commands.add_parser("sections", help="list a project's sections")
+    command.add_argument("project", type=int)
+    command.set_defaults(func=sections)
+
+    for name, func, help in (
+        ("import", import_, "create a section's sentences from a file, one per line"),
+        ("sync", sync, "make a section's sentences match a file, one per line"),
+    ):
+        command = commands.add_parser(name, help=help)
+        command.add_argument("section", type=int)
+        command.add_argument("file")
+        command.add_argument("--page-size", type=int, default=100)
+        command.add_argument("--concurrency", type=int, default=8)
+        command.set_defaults(func=func)
+
+    command = commands.add_parser(
+        "import-translations",
+        help="attach translations from a CSV/TSV of source and target columns",
+    )
+    command.add_argument("target", type=int, help="section id, or project id")
+    command.add_argument("file")
+    command.add_argument("--project", action="store_true", help="target a project")
+    command.add_argument(
+        "--fuzzy", type=float, help="similarity cutoff for inexact matches, e.g. 0.9"
+    )
+    command.add_argument("--page-size", type=int, default=100)
+    command.add_argument("--concurrency", type=int, default=8)
+    command.set_defaults(func=import_translations)
+
+    for name, func, help in (
+        ("crawl", crawl, "save a project snapshot to a directory"),
+        ("export", export, "write a project's sentences and translations as JSONL"),
+    ):
+        command = commands.add_parser(name, help=help)
+        command.add_argument("project", type=int)
+        command.add_argument("output")
+        command.add_argument("--page-size", type=int, default=100)
+        command.add_argument("--concurrency", type=int, default=8)
+        command.set_defaults(func=func)
+
+    command = commands.add_parser(
+        "plan-crawl", help="queue a project's pages for `pytorjoman work`"
+    )
+    command.add_argument("project", type=int)
+    command.add_argument("queue", help="SQLite queue file, may be on a shared disk")
+    command.add_argument("--page-size", type=int, default=100)
+    command.add_argument("--concurrency", type=int, default=8)
+    command.set_defaults(func=plan_crawl)
+
+    command = commands.add_parser(
+        "work", help="crawl a queued project with several processes"
+    )
+    command.add_argument("queue")
+    command.add_argument("output", help="directory receiving <section>/<page>.jsonl")
+    command.add_argument("--processes", type=int, help="defaults to the CPU count")
+    command.add_argument("--concurrency", type=int, default=4, help="per process")
+    command.set_defaults(func=work)
+
+    command = commands.add_parser("bench-import", help="measure import time")
+    command.add_argument("--runs", type=int, default=10)
+    command.set_defaults(func=bench_import)
+
+    args = parser.parse_args(argv)
+    if args.max_connections or args.adaptive:
+        from pytorjoman import configure
+
+        configure(max_connections=args.max_connections, adaptive=args.adaptive)
+    import asyncio
+
+    if not asyncio.iscoroutinefunction(args.func):
+        args.func(args)
+        return
+
+    async def run():
+        from pytorjoman import aclose
+
+        try:
+            await args.func(args)
+        finally:
+            await aclose()
+
+    asyncio.run(run())
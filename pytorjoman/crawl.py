@@ -0,0 +1,289 @@
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import sqlite3
+import time
+from typing import Optional
+
+import pytorjoman
+from pytorjoman._backend import _all_pages, _gather_bounded, priority
+from pytorjoman.errors import TokenExpiredError
+
+_log = logging.getLogger(__name__)
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS tasks (
+    section INTEGER,
+    page INTEGER,
+    state TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    PRIMARY KEY (section, page)
+);
+"""
+
+
+class CrawlCoordinator:
+    """Work queue of (section, page) crawl tasks in a SQLite lease table.
+
+    Workers in any process, or on any host sharing the file, claim a task for
+    `lease_seconds` and renew the lease while working on it; tasks whose
+    lease expired, because their worker crashed, are handed out again. Tasks
+    failing `max_attempts` times move to the 'failed' state with their last
+    error, see `failures`. The database uses SQLite's default rollback
+    journal as WAL doesn't work over network filesystems.
+    """
+
+    def __init__(self, path: str, lease_seconds: float = 300, max_attempts: int = 5):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._db = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self._db.executescript(_SCHEMA)
+
+    @property
+    def page_size(self) -> int:
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'page_size'")
+        return int(row.fetchone()[0])
+
+    async def plan(
+        self,
+        project: "pytorjoman.Project",
+        page_size: int = 100,
+        concurrency: int = 8,
+    ) -> int:
+        """Queue every page of every section of `project`, return the task count."""
+        with priority("bulk"):
+            sections = await project.list_sections()
+            firsts = await _gather_bounded(
+                (section.list_sentences(1, page_size) for section in sections),
+                concurrency,
+            )
+        tasks = [
+            (section.id, page)
+            for section, first in zip(sections, firsts)
+            for page in range(1, -(-first.count // page_size) + 1)
+        ]
+        self._db.execute("BEGIN IMMEDIATE")
+        self._db.execute(
+            "INSERT OR REPLACE INTO meta VALUES ('page_size', ?)", (page_size,)
+        )
+        self._db.executemany(
+            "INSERT OR IGNORE INTO tasks (section, page) VALUES (?, ?)", tasks
+        )
+        self._db.execute("COMMIT")
+        return len(tasks)
+
+    def claim(self, worker: str) -> Optional[tuple[int, int]]:
+        now = time.time()
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            self._db.execute(
+                "UPDATE tasks SET state = 'failed', worker = NULL, expires = NULL,"
+                " error = coalesce(error, 'lease expired')"
+                " WHERE state = 'leased' AND expires < ? AND attempts >= ?",
+                (now, self.max_attempts),
+            )
+            row = self._db.execute(
+                "SELECT section, page FROM tasks"
+                " WHERE (state = 'pending' OR (state = 'leased' AND expires < ?))"
+                " AND attempts < ? ORDER BY attempts, section, page LIMIT 1",
+                (now, self.max_attempts),
+            ).fetchone()
+            if row is not None:
+                self._db.execute(
+                    "UPDATE tasks SET state = 'leased', worker = ?, expires = ?,"
+                    " attempts = attempts + 1 WHERE section = ? AND page = ?",
+                    (worker, now + self.lease_seconds, *row),
+                )
+        finally:
+            self._db.execute("COMMIT")
+        return row
+
+    def renew(self, worker: str, section: int, page: int) -> None:
+        self._db.execute(
+            "UPDATE tasks SET expires = ?"
+            " WHERE section = ? AND page = ? AND worker = ? AND state = 'leased'",
+            (time.time() + self.lease_seconds, section, page, worker),
+        )
+
+    def _finish(
+        self, worker: str, section: int, page: int, assignments: str, *params
+    ) -> None:
+        self._db.execute(
+            f"UPDATE tasks SET {assignments}, worker = NULL, expires = NULL"
+            " WHERE section = ? AND page = ? AND worker = ? AND state = 'leased'",
+            (*params, section, page, worker),
+        )
+
+    def complete(self, worker: str, section: int, page: int) -> None:
+        self._finish(worker, section, page, "state = 'done', error = NULL")
+
+    def release(self, worker: str, section: int, page: int) -> None:
+        """Give a task back right away, without counting the attempt."""
+        self._finish(
+            worker, section, page, "state = 'pending', attempts = attempts - 1"
+        )
+
+    def fail(self, worker: str, section: int, page: int, error: str) -> None:
+        """Record a failed attempt, the task is retried until `max_attempts`."""
+        self._finish(
+            worker,
+            section,
+            page,
+            "state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,"
+            " error = ?",
+            self.max_attempts,
+            error,
+        )
+
+    def progress(self) -> dict[str, int]:
+        rows = self._db.execute("SELECT state, count(*) FROM tasks GROUP BY state")
+        return dict(rows)
+
+    def failures(self) -> list[tuple[int, int, int, str]]:
+        """Tasks given up on, as (section, page, attempts, last error)."""
+        rows = self._db.execute(
+            "SELECT section, page, attempts, error FROM tasks"
+            " WHERE state = 'failed' ORDER BY section, page"
+        )
+        return rows.fetchall()
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def _record(sentence: "pytorjoman.Sentence", translations: list) -> dict:
+    return {
+        "id": sentence.id,
+        "section": sentence.section.id,
+        "sentence": sentence.sentence,
+        "created_at": sentence.created_at,
+        "translations": [
+            {
+                "id": t.id,
+                "translator": t.translator.id if t.translator else None,
+                "translation": t.translation,
+                "is_approved": t.is_approved,
+                "created_at": t.created_at,
+            }
+            for t in translations
+        ],
+    }
+
+
+async def work(
+    path: str,
+    base_url: str,
+    token: str,
+    output: str,
+    worker: Optional[str] = None,
+    concurrency: int = 4,
+    lease_seconds: float = 300,
+) -> int:
+    """Claim and crawl tasks until none are left, return how many were done.
+
+    Each task is written to `<output>/<section>/<page>.jsonl`, one sentence
+    with its translations per line. Failed tasks are logged and left for a
+    retry, an expired token stops the worker with TokenExpiredError.
+    """
+    worker = worker or f"{socket.gethostname()}:{os.getpid()}"
+    coordinator = CrawlCoordinator(path, lease_seconds)
+    page_size = coordinator.page_size
+    sections: dict[int, asyncio.Task] = {}
+    done = 0
+
+    async def crawl_one(section_id: int, page: int) -> None:
+        if section_id not in sections:
+            sections[section_id] = asyncio.ensure_future(
+                pytorjoman.Section.get_section(base_url, token, section_id)
+            )
+        try:
+            section = await sections[section_id]
+        except Exception:
+            sections.pop(section_id, None)
+            raise
+        sentences = (await section.list_sentences(page, page_size)).results
+        translations = await _gather_bounded(
+            (_all_pages(s.list_translations, page_size) for s in sentences),
+            concurrency,
+        )
+        directory = os.path.join(output, str(section_id))
+        os.makedirs(directory, exist_ok=True)
+        tmp = os.path.join(directory, f"{page}.jsonl.{worker}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for sentence, ts in zip(sentences, translations):
+                f.write(json.dumps(_record(sentence, ts), ensure_ascii=False) + "\n")
+        os.replace(tmp, os.path.join(directory, f"{page}.jsonl"))
+
+    async def crawl_leased(section_id: int, page: int) -> None:
+        crawling = asyncio.ensure_future(crawl_one(section_id, page))
+        try:
+            while True:
+                finished, _ = await asyncio.wait(
+                    {crawling}, timeout=coordinator.lease_seconds / 3
+                )
+                if finished:
+                    return crawling.result()
+                coordinator.renew(worker, section_id, page)
+        finally:
+            crawling.cancel()
+
+    async def loop() -> None:
+        nonlocal done
+        while (task := coordinator.claim(worker)) is not None:
+            try:
+                await crawl_leased(*task)
+            except (TokenExpiredError, asyncio.CancelledError):
+                # not the task's fault, and with an expired token every other
+                # task would fail as well, so give it back and stop
+                coordinator.release(worker, *task)
+                raise
+            except Exception as e:
+                _log.warning("crawling section %s page %s failed: %r", *task, e)
+                coordinator.fail(worker, *task, repr(e))
+                continue
+            coordinator.complete(worker, *task)
+            done += 1
+
+    with priority("bulk"):
+        loops = [asyncio.ensure_future(loop()) for _ in range(concurrency)]
+    try:
+        await asyncio.gather(*loops)
+    finally:
+        for task in loops:
+            task.cancel()
+        await asyncio.gather(*loops, return_exceptions=True)
+        coordinator.close()
+    return done
+
+
+def _work_process(*args) -> None:
+    asyncio.run(work(*args))
+
+
+def run(
+    path: str,
+    base_url: str,
+    token: str,
+    output: str,
+    processes: Optional[int] = None,
+    concurrency: int = 4,
+) -> None:
+    """Crawl a planned queue with `processes` worker processes on this host."""
+    workers = [
+        multiprocessing.Process(
+            target=_work_process,
+            args=(path, base_url, token, output, None, concurrency),
+        )
+        for _ in range(processes or os.cpu_count() or 1)
+    ]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join()
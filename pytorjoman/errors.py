@@ -24,3 +24,7 @@ class TokenExpiredError(Exception):
 
 class NotAllowedError(Exception):
     pass
+
+
+class RequestBudgetExceededError(AssertionError):
+    pass
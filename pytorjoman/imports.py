@@ -0,0 +1,166 @@
+import asyncio
+import csv
+import difflib
+import heapq
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional, Union
+
+import pytorjoman
+from pytorjoman._backend import _all_pages, _gather_bounded, priority
+from pytorjoman.errors import AlreadyExistError
+from pytorjoman.search import normalize
+
+
+def _key(text: str) -> str:
+    return " ".join(normalize(text).split())
+
+
+def read_pairs(path: str) -> list[tuple[str, str]]:
+    """Read source/target pairs from the first two columns of a CSV or TSV file."""
+    with open(path, encoding="utf-8", newline="") as f:
+        dialect = "excel-tab" if path.endswith((".tsv", ".tab", ".txt")) else "excel"
+        return [(row[0], row[1]) for row in csv.reader(f, dialect) if len(row) >= 2]
+
+
+def _trigrams(key: str) -> set[str]:
+    padded = f"  {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class _FuzzyIndex:
+    """Closest key lookup, only scoring the keys sharing the most trigrams with it.
+
+    An inverted index from trigrams to the keys holding them picks the
+    `candidates` keys of a suitable length with the most trigrams in common,
+    difflib only compares those.
+    """
+
+    def __init__(self, keys: Iterable[str], cutoff: float, candidates: int = 50):
+        self.cutoff = cutoff
+        self.candidates = candidates
+        self.keys = list(keys)
+        self.postings: dict[str, list[int]] = {}
+        for i, key in enumerate(self.keys):
+            for gram in _trigrams(key):
+                self.postings.setdefault(gram, []).append(i)
+
+    def match(self, key: str) -> Optional[str]:
+        shared: Counter[int] = Counter()
+        for gram in _trigrams(key):
+            shared.update(self.postings.get(gram, ()))
+        # ratio() is at most 2 * min(a, b) / (a + b)
+        low = len(key) * self.cutoff / (2 - self.cutoff)
+        high = len(key) * (2 - self.cutoff) / self.cutoff
+        best = heapq.nlargest(
+            self.candidates,
+            (i for i in shared if low <= len(self.keys[i]) <= high),
+            key=shared.__getitem__,
+        )
+        candidates = [self.keys[i] for i in best]
+        matches = difflib.get_close_matches(key, candidates, 1, self.cutoff)
+        return matches[0] if matches else None
+
+
+def _match_fuzzy(
+    keys: list[str], missing: Iterable[str], cutoff: float
+) -> dict[str, Optional[str]]:
+    index = _FuzzyIndex(keys, cutoff)
+    return {key: index.match(key) for key in missing}
+
+
+@dataclass
+class ImportReport:
+    created: list["pytorjoman.Translation"] = field(default_factory=list)
+    already_present: list[tuple["pytorjoman.Sentence", str]] = field(
+        default_factory=list
+    )
+    # incoming source text and the sentence it was fuzzily matched to
+    fuzzy: list[tuple[str, "pytorjoman.Sentence"]] = field(default_factory=list)
+    unmatched: list[tuple[str, str]] = field(default_factory=list)
+    failed: list[tuple["pytorjoman.Sentence", str, Exception]] = field(
+        default_factory=list
+    )
+
+
+async def import_translations(
+    target: Union["pytorjoman.Section", "pytorjoman.Project"],
+    pairs: Iterable[tuple[str, str]],
+    fuzzy_cutoff: Optional[float] = None,
+    page_size: int = 100,
+    concurrency: int = 8,
+    on_progress: Optional[Callable[[int], None]] = None,
+) -> ImportReport:
+    """Attach translations to the existing sentences whose text they translate.
+
+    The target's sentences are crawled once and indexed by normalized text,
+    pairs whose source isn't found exactly are matched to the closest
+    sentence with a similarity of at least `fuzzy_cutoff`, when given, in a
+    thread so the event loop keeps running.
+    A source present in several sentences gets the translation on each.
+    Translations the server already has (409) are reported as already present.
+    `on_progress` is called with counts of the pairs dealt with.
+    """
+    report = ImportReport()
+    with priority("bulk"):
+        if isinstance(target, pytorjoman.Project):
+            sections = await target.list_sections()
+        else:
+            sections = [target]
+        crawled = await _gather_bounded(
+            (
+                _all_pages(section.list_sentences, page_size, concurrency)
+                for section in sections
+            ),
+            concurrency,
+        )
+        index: dict[str, list[pytorjoman.Sentence]] = {}
+        for sentences in crawled:
+            for sentence in sentences:
+                index.setdefault(_key(sentence.sentence), []).append(sentence)
+
+        keyed = [(_key(source), source, translation) for source, translation in pairs]
+        closest: dict[str, Optional[str]] = {}
+        missing = {key for key, _, _ in keyed if key not in index}
+        if fuzzy_cutoff and missing:
+            # building the index and scoring are CPU bound, keep the loop free
+            closest = await asyncio.get_running_loop().run_in_executor(
+                None, _match_fuzzy, list(index), missing, fuzzy_cutoff
+            )
+        matched: list[tuple[int, pytorjoman.Sentence, str]] = []
+        # uploads left for each pair
+        left: list[int] = []
+        for n, (key, source, translation) in enumerate(keyed):
+            if closest.get(key) is not None:
+                key = closest[key]
+                report.fuzzy += [(source, s) for s in index[key]]
+            if key in index:
+                matched += [(n, sentence, translation) for sentence in index[key]]
+                left.append(len(index[key]))
+            else:
+                report.unmatched.append((source, translation))
+                left.append(0)
+        if on_progress is not None:
+            on_progress(len(report.unmatched))
+
+        async def upload(n: int, sentence: pytorjoman.Sentence, text: str):
+            try:
+                return await sentence.create_translation(text)
+            finally:
+                left[n] -= 1
+                if not left[n] and on_progress is not None:
+                    on_progress(1)
+
+        results = await _gather_bounded(
+            (upload(*item) for item in matched),
+            concurrency,
+            return_exceptions=True,
+        )
+    for (_, sentence, translation), result in zip(matched, results):
+        if isinstance(result, AlreadyExistError):
+            report.already_present.append((sentence, translation))
+        elif isinstance(result, Exception):
+            report.failed.append((sentence, translation, result))
+        else:
+            report.created.append(result)
+    return report
@@ -0,0 +1,236 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Callable, Optional, Union
+
+import pytorjoman
+from pytorjoman._backend import _gather_bounded, priority
+from pytorjoman.errors import (
+    AlreadyExistError,
+    NotAllowedError,
+    NotFoundError,
+)
+
+_log = logging.getLogger(__name__)
+# failures that retrying won't fix, anything else is retried on the next
+# replay, including a proxy's error page failing to decode as JSON, which is
+# a ValueError too
+_PERMANENT = (NotFoundError, NotAllowedError, ValueError)
+
+Target = Union[
+    "pytorjoman.Account",
+    "pytorjoman.Project",
+    "pytorjoman.Section",
+    "pytorjoman.Sentence",
+]
+
+
+def _kind(obj: Target) -> str:
+    match obj:
+        case pytorjoman.Account():
+            return "accounts"
+        case pytorjoman.Project():
+            return "projects"
+        case pytorjoman.Section():
+            return "sections"
+        case pytorjoman.Sentence():
+            return "sentences"
+    raise TypeError(f"{type(obj).__name__} can't be journaled")
+
+
+def _read_lines(path: str) -> list[dict]:
+    if not os.path.exists(path):
+        return []
+    entries = []
+    with open(path) as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                # a torn write from a crash, everything after it is lost anyway
+                break
+    return entries
+
+
+class Journal:
+    """Durable write-behind queue for mutations.
+
+    Mutations are appended to an on-disk journal and acknowledged right away
+    with a sequence number, `replay` then sends them to the server, in order
+    for each object, and records completed entries in `<path>.done`, fsynced
+    every `batch_size` of them, so a restarted process picks up where the
+    previous one stopped. Creations that the server already has (409) count
+    as completed.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        account: "pytorjoman.Account",
+        concurrency: int = 8,
+        batch_size: int = 100,
+        on_applied: Optional[Callable[[int, Any], None]] = None,
+    ):
+        self.path = path
+        self.account = account
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.on_applied = on_applied
+        self.failed: dict[int, str] = {}
+        done = _read_lines(f"{path}.done")
+        self._done = {d["seq"] for d in done}
+        self.failed.update({d["seq"]: d["error"] for d in done if d.get("error")})
+        entries = _read_lines(path)
+        # compact() starts the journal with a marker holding the last sequence
+        # number, so numbers aren't reused once their entries are gone
+        self._seq = max((e["seq"] for e in entries), default=0)
+        self._pending = [e for e in entries if "op" in e and e["seq"] not in self._done]
+        self._unsynced = 0
+        self._objects: dict[str, Target] = {}
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._journal = open(path, "a")
+        self._done_file = open(f"{path}.done", "a")
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _append(self, target: Target, op: str, args: dict) -> int:
+        self._seq += 1
+        key = f"{_kind(target)}/{target.id}"
+        entry = {"seq": self._seq, "key": key, "op": op, "args": args}
+        self._journal.write(json.dumps(entry, default=str) + "\n")
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._objects[key] = target
+        self._pending.append(entry)
+        return self._seq
+
+    def create_sentence(self, section: "pytorjoman.Section", sentence: str) -> int:
+        return self._append(section, "create_sentence", {"sentence": sentence})
+
+    def create_translation(
+        self, sentence: "pytorjoman.Sentence", translation: str
+    ) -> int:
+        return self._append(
+            sentence, "create_translation", {"translation": translation}
+        )
+
+    def update(self, target: Target, **kwargs) -> int:
+        return self._append(target, "update", kwargs)
+
+    async def _resolve(self, key: str) -> Target:
+        if key not in self._objects:
+            kind, id = key.split("/")
+            base_url, token = self.account.base_url, self.account._access_token
+            match kind:
+                case "accounts":
+                    obj = self.account
+                case "projects":
+                    obj = await pytorjoman.Project.get_project(base_url, token, int(id))
+                case "sections":
+                    obj = await pytorjoman.Section.get_section(base_url, token, int(id))
+                case "sentences":
+                    obj = await pytorjoman.Sentence.get_sentence(
+                        base_url, token, int(id)
+                    )
+            self._objects[key] = obj
+        return self._objects[key]
+
+    def _finish(self, record: dict) -> None:
+        self._done.add(record["seq"])
+        if "error" in record:
+            self.failed[record["seq"]] = record["error"]
+        self._done_file.write(json.dumps(record) + "\n")
+        self._unsynced += 1
+        if self._unsynced >= self.batch_size:
+            self._sync_done()
+
+    def _sync_done(self) -> None:
+        self._done_file.flush()
+        os.fsync(self._done_file.fileno())
+        self._unsynced = 0
+
+    async def _run_chain(self, chain: list[dict]) -> int:
+        """Apply one object's entries in order, stopping at a transient failure."""
+        for i, entry in enumerate(chain):
+            try:
+                target = await self._resolve(entry["key"])
+                result = await getattr(target, entry["op"])(**entry["args"])
+            except AlreadyExistError:
+                result = None
+            except json.JSONDecodeError:
+                return i
+            except _PERMANENT as e:
+                _log.warning("journal entry %s failed for good: %r", entry["seq"], e)
+                self._finish({"seq": entry["seq"], "error": repr(e)})
+                continue
+            except Exception:
+                return i
+            self._finish({"seq": entry["seq"]})
+            if self.on_applied is not None:
+                self.on_applied(entry["seq"], result)
+        return len(chain)
+
+    async def replay(self) -> int:
+        """Send pending entries to the server, return how many were completed.
+
+        Objects are replayed concurrently, each as soon as a slot is free, so
+        a slow or failing object holds up only its own entries.
+        """
+        async with self._lock:
+            chains: dict[str, list[dict]] = {}
+            for entry in self._pending:
+                chains.setdefault(entry["key"], []).append(entry)
+            try:
+                with priority("bulk"):
+                    completed = await _gather_bounded(
+                        (self._run_chain(chain) for chain in chains.values()),
+                        self.concurrency,
+                    )
+            finally:
+                self._sync_done()
+                self._pending = [e for e in self._pending if e["seq"] not in self._done]
+            return sum(completed)
+
+    def start(self, interval: float = 5.0) -> None:
+        """Replay in the background every `interval` seconds."""
+
+        async def loop():
+            while True:
+                try:
+                    await self.replay()
+                except Exception:
+                    _log.exception("replaying %s failed", self.path)
+                await asyncio.sleep(interval)
+
+        self._task = asyncio.create_task(loop())
+
+    async def compact(self) -> None:
+        """Rewrite the journal keeping only pending entries."""
+        async with self._lock:
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w") as f:
+                f.write(json.dumps({"seq": self._seq}) + "\n")
+                for entry in self._pending:
+                    f.write(json.dumps(entry, default=str) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._journal.close()
+            self._done_file.close()
+            os.replace(tmp, self.path)
+            self._done.clear()
+            self._journal = open(self.path, "a")
+            self._done_file = open(f"{self.path}.done", "w")
+
+    async def aclose(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        await self.replay()
+        self._journal.close()
+        self._done_file.close()
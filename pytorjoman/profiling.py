@@ -0,0 +1,126 @@
+import json
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+from urllib import parse
+
+from pytorjoman._backend import _recorders
+from pytorjoman.errors import RequestBudgetExceededError
+
+_ID = re.compile(r"(?<=/)\d+(?=/|$)")
+
+
+def endpoint(method: str, url: str) -> str:
+    """`GET https://host/api/v1/sections/12` -> `GET /api/v1/sections/{id}`."""
+    return f"{method} {_ID.sub('{id}', parse.urlsplit(url).path)}"
+
+
+@dataclass
+class EndpointStats:
+    calls: int = 0
+    total_time: float = 0.0
+    # waiting for a slot in the scheduler, not part of total_time
+    queue_time: float = 0.0
+    statuses: Counter = field(default_factory=Counter)
+
+
+class Profile:
+    """Record every request made inside a block, including in tasks it starts.
+
+        with Profile(max_requests=3) as profile:
+            await account.get_sentences_for_user(project=1)
+        print(profile.report())
+
+    With `max_requests`, or `max_identical` for how many times one identical
+    request may be sent, leaving the block raises RequestBudgetExceededError
+    when the budget is exceeded. Requests that failed without an answer are
+    counted under the exception's name instead of a status code.
+    """
+
+    def __init__(
+        self, max_requests: Optional[int] = None, max_identical: Optional[int] = None
+    ):
+        self.max_requests = max_requests
+        self.max_identical = max_identical
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.requests: Counter = Counter()
+        self._token = None
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        params: dict,
+        data: Optional[dict],
+        status: int | str,
+        elapsed: float,
+        queued: float = 0.0,
+    ) -> None:
+        stats = self.endpoints.setdefault(endpoint(method, url), EndpointStats())
+        stats.calls += 1
+        stats.total_time += elapsed
+        stats.queue_time += queued
+        stats.statuses[status] += 1
+        key = (
+            method,
+            url,
+            json.dumps(params, sort_keys=True, default=str),
+            json.dumps(data, sort_keys=True, default=str),
+        )
+        self.requests[key] += 1
+
+    @property
+    def total_requests(self) -> int:
+        return sum(stats.calls for stats in self.endpoints.values())
+
+    @property
+    def total_time(self) -> float:
+        return sum(stats.total_time for stats in self.endpoints.values())
+
+    @property
+    def queue_time(self) -> float:
+        return sum(stats.queue_time for stats in self.endpoints.values())
+
+    @property
+    def repeated(self) -> dict[tuple, int]:
+        """Requests that were sent more than once, with how many times."""
+        return {key: count for key, count in self.requests.items() if count > 1}
+
+    def report(self) -> str:
+        lines = [
+            f"{self.total_requests} requests in {self.total_time:.3f}s"
+            f" ({self.queue_time:.3f}s queued)"
+        ]
+        for name, stats in sorted(
+            self.endpoints.items(), key=lambda item: -item[1].total_time
+        ):
+            lines.append(
+                f"{stats.calls:>6} {stats.total_time:>9.3f}s {stats.queue_time:>9.3f}s"
+                f"  {name}  {dict(stats.statuses)}"
+            )
+        for (method, url, params, data), count in sorted(
+            self.repeated.items(), key=lambda item: -item[1]
+        ):
+            lines.append(f"repeated x{count}: {method} {url} {params} {data}")
+        return "\n".join(lines)
+
+    def __enter__(self) -> "Profile":
+        self._token = _recorders.set(_recorders.get() + (self,))
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _recorders.reset(self._token)
+        if exc_type is not None:
+            return
+        if self.max_requests is not None and self.total_requests > self.max_requests:
+            raise RequestBudgetExceededError(
+                f"expected at most {self.max_requests} requests\n{self.report()}"
+            )
+        if self.max_identical is not None and any(
+            count > self.max_identical for count in self.requests.values()
+        ):
+            raise RequestBudgetExceededError(
+                f"expected no request sent more than {self.max_identical} times"
+                f"\n{self.report()}"
+            )
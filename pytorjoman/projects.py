@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Callable, Optional
 from urllib import parse
 
 import pytorjoman
-from pytorjoman._backend import Model, ModelList, _call
+from pytorjoman._backend import Model, ModelList, _call, _fetch_many
 from pytorjoman.errors import (
     AlreadyExistError,
     NotAllowedError,
@@ -11,6 +12,7 @@ from pytorjoman.errors import (
     TokenExpiredError,
     UnknownError,
 )
+from pytorjoman.snapshots import Snapshot
 
 
 @dataclass
@@ -107,6 +109,18 @@ class Project(Model):
             case _:
                 raise UnknownError()
 
+    @staticmethod
+    async def get_many(
+        base_url: str, token: str, projects: list[int], concurrency: int = 16
+    ) -> list["Project | Exception"]:
+        """Get projects by id, in order, with the error instead of a failed one."""
+        found = await _fetch_many(
+            projects,
+            lambda project: Project.get_project(base_url, token, project),
+            concurrency,
+        )
+        return [found[project] for project in projects]
+
     @staticmethod
     async def get_project(base_url: str, token: str, project: int):
         status, res = await _call(
@@ -157,3 +171,11 @@ class Project(Model):
             self.base_url, self._access_token, self
         )
         return sections
+
+    async def snapshot(
+        self,
+        page_size: int = 100,
+        concurrency: int = 8,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> Snapshot:
+        return await Snapshot.build(self, page_size, concurrency, on_progress)
@@ -0,0 +1,229 @@
+import bisect
+import re
+import unicodedata
+from typing import Iterable, Optional
+
+import pytorjoman
+from pytorjoman._backend import ModelList, _all_pages, _gather_bounded, priority
+
+_MAGIC = b"PTJIDX1\n"
+_TOKEN = re.compile(r"\w+")
+_QUERY = re.compile(r'"([^"]*)"|(\S+)')
+# alef wasla, alef maqsura and teh marbuta, tatweel is dropped
+_LETTERS = str.maketrans({"ٱ": "ا", "ى": "ي", "ة": "ه"})
+_KINDS = ("sentence", "translation")
+
+
+def normalize(text: str) -> str:
+    """Fold case, diacritics and Arabic letter variants.
+
+    Decomposing first turns hamza and madda carrying letters (أ إ آ ؤ ئ) into
+    their base letter plus a combining mark, which is then dropped together
+    with harakat and Latin accents.
+    """
+    if text.isascii():
+        return text.casefold()
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if unicodedata.category(c) != "Mn" and c != "ـ")
+    return text.translate(_LETTERS).casefold()
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(normalize(text))
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class SearchIndex:
+    """Local inverted index over sentences and translations.
+
+    Feed it whatever the list, create and get methods return, and again after
+    an `update()`; re-adding an object replaces its previous text. Queries
+    are words, `prefix*` and `"quoted phrases"`, all of which must match.
+    Results are `(kind, id)` pairs where kind is "sentence" or "translation".
+    """
+
+    def __init__(self):
+        # term -> {document: positions}, documents are id * 2 + kind
+        self.postings: dict[str, dict[int, list[int]]] = {}
+        self._documents: dict[int, set[str]] = {}
+        self._terms: Optional[list[str]] = None
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def _put(self, document: int, text: str) -> None:
+        self._remove(document)
+        terms = set()
+        for position, term in enumerate(tokenize(text)):
+            if term not in self.postings:
+                self.postings[term] = {}
+                self._terms = None
+            self.postings[term].setdefault(document, []).append(position)
+            terms.add(term)
+        self._documents[document] = terms
+
+    def _remove(self, document: int) -> None:
+        for term in self._documents.pop(document, ()):
+            postings = self.postings[term]
+            del postings[document]
+            if not postings:
+                del self.postings[term]
+                self._terms = None
+
+    def add(self, *items) -> None:
+        """Index sentences and translations, also inside lists and ModelLists."""
+        for item in items:
+            match item:
+                case pytorjoman.Sentence():
+                    self._put(item.id * 2, item.sentence)
+                case pytorjoman.Translation():
+                    self._put(item.id * 2 + 1, item.translation)
+                case ModelList():
+                    self.add(*item.results)
+                case list() | tuple():
+                    self.add(*item)
+                case {"sentence": pytorjoman.Sentence() as sentence}:
+                    self.add(sentence)
+
+    def remove(self, *items) -> None:
+        for item in items:
+            match item:
+                case pytorjoman.Sentence():
+                    self._remove(item.id * 2)
+                case pytorjoman.Translation():
+                    self._remove(item.id * 2 + 1)
+
+    async def crawl(
+        self,
+        section: "pytorjoman.Section",
+        translations: bool = True,
+        page_size: int = 100,
+        concurrency: int = 8,
+    ) -> None:
+        """Index every sentence of a section, and their translations."""
+        with priority("bulk"):
+            sentences = await _all_pages(section.list_sentences, page_size, concurrency)
+            self.add(sentences)
+            if translations:
+                self.add(
+                    await _gather_bounded(
+                        (
+                            _all_pages(s.list_translations, page_size, concurrency)
+                            for s in sentences
+                        ),
+                        concurrency,
+                    )
+                )
+
+    def _prefixed(self, prefix: str) -> set[int]:
+        if self._terms is None:
+            self._terms = sorted(self.postings)
+        documents: set[int] = set()
+        start = bisect.bisect_left(self._terms, prefix)
+        for term in self._terms[start:]:
+            if not term.startswith(prefix):
+                break
+            documents.update(self.postings[term])
+        return documents
+
+    def _phrase(self, terms: list[str]) -> set[int]:
+        postings = [self.postings.get(term, {}) for term in terms]
+        documents = set(min(postings, key=len))
+        for other in postings:
+            documents.intersection_update(other)
+        if len(terms) == 1:
+            return documents
+        return {
+            document
+            for document in documents
+            if any(
+                all(start + i in postings[i][document] for i in range(1, len(terms)))
+                for start in postings[0][document]
+            )
+        }
+
+    def search(self, query: str, kind: Optional[str] = None) -> list[tuple[str, int]]:
+        matches: Optional[set[int]] = None
+        for phrase, word in _QUERY.findall(query):
+            if word.endswith("*") and len(tokenize(word)) == 1:
+                found = self._prefixed(tokenize(word)[0])
+            elif terms := tokenize(phrase or word):
+                found = self._phrase(terms)
+            else:
+                continue
+            matches = found if matches is None else matches & found
+            if not matches:
+                break
+        documents: Iterable[int] = sorted(matches or ())
+        if kind is not None:
+            documents = (d for d in documents if _KINDS[d & 1] == kind)
+        return [(_KINDS[d & 1], d >> 1) for d in documents]
+
+    def save(self, path: str) -> None:
+        """Write the postings with varint delta encoding."""
+        out = bytearray(_MAGIC)
+        _write_varint(out, len(self.postings))
+        for term in sorted(self.postings):
+            encoded = term.encode()
+            _write_varint(out, len(encoded))
+            out += encoded
+            postings = self.postings[term]
+            _write_varint(out, len(postings))
+            previous_document = 0
+            for document in sorted(postings):
+                _write_varint(out, document - previous_document)
+                previous_document = document
+                positions = postings[document]
+                _write_varint(out, len(positions))
+                previous_position = 0
+                for position in positions:
+                    _write_varint(out, position - previous_position)
+                    previous_position = position
+        with open(path, "wb") as f:
+            f.write(out)
+
+    @staticmethod
+    def load(path: str) -> "SearchIndex":
+        with open(path, "rb") as f:
+            data = f.read()
+        if not data.startswith(_MAGIC):
+            raise ValueError(f"{path} is not a search index")
+        index = SearchIndex()
+        offset = len(_MAGIC)
+        terms, offset = _read_varint(data, offset)
+        for _ in range(terms):
+            length, offset = _read_varint(data, offset)
+            term = data[offset : offset + length].decode()
+            offset += length
+            count, offset = _read_varint(data, offset)
+            postings = index.postings[term] = {}
+            document = 0
+            for _ in range(count):
+                delta, offset = _read_varint(data, offset)
+                document += delta
+                positions, offset = _read_varint(data, offset)
+                position = 0
+                postings[document] = []
+                for _ in range(positions):
+                    delta, offset = _read_varint(data, offset)
+                    position += delta
+                    postings[document].append(position)
+                index._documents.setdefault(document, set()).add(term)
+        return index
@@ -1,8 +1,18 @@
-from dataclasses import dataclass
+import difflib
+import hashlib
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Awaitable, Callable, Iterable, Optional
 
 import pytorjoman
-from pytorjoman._backend import Model, _call
+from pytorjoman._backend import (
+    Model,
+    _all_pages,
+    _call,
+    _fetch_many,
+    _gather_bounded,
+    priority,
+)
 from pytorjoman.errors import (
     AlreadyExistError,
     NotAllowedError,
@@ -12,6 +22,20 @@ from pytorjoman.errors import (
 )
 
 
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+@dataclass
+class SyncReport:
+    unchanged: int = 0
+    created: list["pytorjoman.Sentence"] = field(default_factory=list)
+    updated: list["pytorjoman.Sentence"] = field(default_factory=list)
+    # there is no API to delete sentences, these are left as they are
+    removed: list["pytorjoman.Sentence"] = field(default_factory=list)
+    failed: list[tuple[str, Exception]] = field(default_factory=list)
+
+
 @dataclass
 class Section(Model):
     id: int
@@ -34,7 +58,7 @@ class Section(Model):
                 return [
                     Section(
                         base_url,
-                        "projects",
+                        "sections",
                         token,
                         s["id"],
                         project,
@@ -68,7 +92,7 @@ class Section(Model):
             case 200:
                 return Section(
                     base_url,
-                    "projects",
+                    "sections",
                     token,
                     res["id"],
                     project,
@@ -87,28 +111,72 @@ class Section(Model):
                 raise UnknownError()
 
     @staticmethod
-    async def get_section(base_url: str, token: str, section: int):
+    async def _get_json(base_url: str, section: int) -> dict:
         status, res = await _call(
             f"{base_url}/api/v1/sections/{section}", "GET", with_auth=False
         )
         match status:
             case 200:
-                return Section(
-                    base_url,
-                    "projects",
-                    token,
-                    res["id"],
-                    await pytorjoman.Project.get_project(
-                        base_url, token, res["project"]
-                    ),
-                    res["name"],
-                    res["created_at"],
-                )
+                return res
             case 404:
                 raise NotFoundError("section not found")
             case _:
                 raise UnknownError()
 
+    @staticmethod
+    async def get_section(base_url: str, token: str, section: int):
+        res = await Section._get_json(base_url, section)
+        return Section(
+            base_url,
+            "sections",
+            token,
+            res["id"],
+            await pytorjoman.Project.get_project(base_url, token, res["project"]),
+            res["name"],
+            res["created_at"],
+        )
+
+    @staticmethod
+    async def _get_many(
+        base_url: str, token: str, sections: Iterable[int], concurrency: int
+    ) -> dict[int, "Section | Exception"]:
+        found = await _fetch_many(
+            sections, lambda section: Section._get_json(base_url, section), concurrency
+        )
+        projects = await _fetch_many(
+            (res["project"] for res in found.values() if isinstance(res, dict)),
+            lambda project: pytorjoman.Project.get_project(base_url, token, project),
+            concurrency,
+        )
+        for section, res in found.items():
+            if isinstance(res, Exception):
+                continue
+            project = projects[res["project"]]
+            if isinstance(project, Exception):
+                found[section] = project
+                continue
+            found[section] = Section(
+                base_url,
+                "sections",
+                token,
+                res["id"],
+                project,
+                res["name"],
+                res["created_at"],
+            )
+        return found
+
+    @staticmethod
+    async def get_many(
+        base_url: str, token: str, sections: list[int], concurrency: int = 16
+    ) -> list["Section | Exception"]:
+        """Get sections by id, in order, with the error instead of a failed one.
+
+        Every project is fetched once however many of the sections share it.
+        """
+        found = await Section._get_many(base_url, token, sections, concurrency)
+        return [found[section] for section in sections]
+
     async def update(self, new_name: str):
         status, res = await self._call(
             "update", "PUT", data={"id": self.id, "new_name": new_name}
@@ -138,3 +206,83 @@ class Section(Model):
             self.base_url, self._access_token, self, page, page_size
         )
         return sentences
+
+    async def sync_from(
+        self,
+        sentences: list[str],
+        page_size: int = 100,
+        concurrency: int = 8,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> SyncReport:
+        """Make the section's sentences match `sentences` with as few calls as possible.
+
+        Current and new sentences are aligned with a sequence diff over their
+        content hashes. Sentences the diff leaves unaligned but whose content
+        exists on both sides, e.g. one inserted by an earlier sync and so
+        listed last, are kept as they are. In what remains, changed runs are
+        updated in place, extra new sentences are created and extra current
+        ones are reported as removed. `on_progress` is called with counts of
+        the new sentences dealt with, unchanged ones first.
+        """
+        with priority("bulk"):
+            current = await _all_pages(self.list_sentences, page_size, concurrency)
+            current.sort(key=lambda s: s.id)
+            old_digests = [_digest(s.sentence) for s in current]
+            new_digests = [_digest(s) for s in sentences]
+            matcher = difflib.SequenceMatcher(
+                None, old_digests, new_digests, autojunk=False
+            )
+            report = SyncReport()
+            changed = []
+            unmatched: dict[bytes, list[int]] = {}
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                if tag == "equal":
+                    report.unchanged += i2 - i1
+                    continue
+                changed.append((range(i1, i2), range(j1, j2)))
+                for i in range(i1, i2):
+                    unmatched.setdefault(old_digests[i], []).append(i)
+            kept_old, kept_new = set(), set()
+            for _, new in changed:
+                for j in new:
+                    if unmatched.get(new_digests[j]):
+                        kept_old.add(unmatched[new_digests[j]].pop(0))
+                        kept_new.add(j)
+            report.unchanged += len(kept_new)
+            updates, creates = [], []
+            for old, new in changed:
+                old = [current[i] for i in old if i not in kept_old]
+                new = [sentences[j] for j in new if j not in kept_new]
+                paired = min(len(old), len(new))
+                updates += zip(old[:paired], new[:paired])
+                report.removed += old[paired:]
+                creates += new[paired:]
+            if on_progress is not None:
+                on_progress(report.unchanged)
+
+            async def update(sentence: pytorjoman.Sentence, text: str):
+                await sentence.update(text)
+                return sentence
+
+            async def counted(aw: Awaitable):
+                try:
+                    return await aw
+                finally:
+                    if on_progress is not None:
+                        on_progress(1)
+
+            results = await _gather_bounded(
+                [counted(update(sentence, text)) for sentence, text in updates]
+                + [counted(self.create_sentence(text)) for text in creates],
+                concurrency,
+                return_exceptions=True,
+            )
+            texts = [text for _, text in updates] + creates
+            for i, (text, result) in enumerate(zip(texts, results)):
+                if isinstance(result, Exception):
+                    report.failed.append((text, result))
+                elif i < len(updates):
+                    report.updated.append(result)
+                else:
+                    report.created.append(result)
+            return report
@@ -3,7 +3,7 @@ from datetime import datetime
 from urllib import parse
 
 import pytorjoman
-from pytorjoman._backend import Model, ModelList, _call
+from pytorjoman._backend import Model, ModelList, _call, _fetch_many
 from pytorjoman.errors import (
     AlreadyExistError,
     NotAllowedError,
@@ -51,7 +51,7 @@ class Sentence(Model):
                     [
                         Sentence(
                             base_url,
-                            "sections",
+                            "sentences",
                             token,
                             s["id"],
                             section,
@@ -86,7 +86,7 @@ class Sentence(Model):
             case 200:
                 return Sentence(
                     base_url,
-                    "sections",
+                    "sentences",
                     token,
                     res["id"],
                     section,
@@ -105,28 +105,69 @@ class Sentence(Model):
                 raise UnknownError()
 
     @staticmethod
-    async def get_sentence(base_url: str, token: str, sentence: int):
+    async def _get_json(base_url: str, sentence: int) -> dict:
         status, res = await _call(
             f"{base_url}/api/v1/sentences/{sentence}", "GET", with_auth=False
         )
         match status:
             case 200:
-                return Sentence(
-                    base_url,
-                    "projects",
-                    token,
-                    res["id"],
-                    await pytorjoman.Section.get_section(
-                        base_url, token, res["section"]
-                    ),
-                    res["name"],
-                    res["created_at"],
-                )
+                return res
             case 404:
                 raise NotFoundError("sentence not found")
             case _:
                 raise UnknownError()
 
+    @staticmethod
+    async def get_sentence(base_url: str, token: str, sentence: int):
+        res = await Sentence._get_json(base_url, sentence)
+        return Sentence(
+            base_url,
+            "sentences",
+            token,
+            res["id"],
+            await pytorjoman.Section.get_section(base_url, token, res["section"]),
+            res["sentence"],
+            res["created_at"],
+        )
+
+    @staticmethod
+    async def get_many(
+        base_url: str, token: str, sentences: list[int], concurrency: int = 16
+    ) -> list["Sentence | Exception"]:
+        """Get sentences by id, in order, with the error instead of a failed one.
+
+        Every section and project is fetched once however many of the
+        sentences share it.
+        """
+        found = await _fetch_many(
+            sentences,
+            lambda sentence: Sentence._get_json(base_url, sentence),
+            concurrency,
+        )
+        sections = await pytorjoman.Section._get_many(
+            base_url,
+            token,
+            (res["section"] for res in found.values() if isinstance(res, dict)),
+            concurrency,
+        )
+        for sentence, res in found.items():
+            if isinstance(res, Exception):
+                continue
+            section = sections[res["section"]]
+            if isinstance(section, Exception):
+                found[sentence] = section
+                continue
+            found[sentence] = Sentence(
+                base_url,
+                "sentences",
+                token,
+                res["id"],
+                section,
+                res["sentence"],
+                res["created_at"],
+            )
+        return [found[sentence] for sentence in sentences]
+
     async def update(self, new_sentence: str):
         status, res = await self._call(
             "update", "PUT", data={"id": self.id, "new_sentence": new_sentence}
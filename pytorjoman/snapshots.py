@@ -0,0 +1,243 @@
+import json
+import math
+import mmap
+import os
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import compress
+from typing import Callable, Iterable, Optional, Sequence
+
+import pytorjoman
+from pytorjoman._backend import _all_pages, _gather_bounded, priority
+
+
+def _timestamp(value: datetime | str | None) -> float:
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if not value:
+        return math.nan
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+class StringPool:
+    """All strings of a table stored back to back in a single utf-8 buffer."""
+
+    def __init__(self, data=None, offsets: Optional[Sequence[int]] = None):
+        self.data = data if data is not None else bytearray()
+        self.offsets = offsets if offsets is not None else array("Q", [0])
+
+    def append(self, value: str) -> int:
+        self.data += value.encode()
+        self.offsets.append(len(self.data))
+        return len(self.offsets) - 2
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return str(self.data[self.offsets[index] : self.offsets[index + 1]], "utf-8")
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+class Table:
+    """Typed columns of equal length plus an optional string pool."""
+
+    def __init__(self, columns: dict[str, Sequence], text: Optional[StringPool] = None):
+        self.columns = columns
+        self.text = text if text is not None else StringPool()
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values())))
+
+    def __getitem__(self, column: str) -> Sequence:
+        return self.columns[column]
+
+    def filter(self, column: str, predicate: Callable[[object], bool]) -> array:
+        """Row indices whose `column` value satisfies `predicate`."""
+        return array(
+            "q", compress(range(len(self)), map(predicate, self.columns[column]))
+        )
+
+    def take(self, column: str, rows: Iterable[int]) -> list:
+        values = self.columns[column]
+        return [values[row] for row in rows]
+
+    def group_count(self, key: str, rows: Optional[Iterable[int]] = None) -> Counter:
+        if rows is None:
+            return Counter(self.columns[key])
+        return Counter(self.take(key, rows))
+
+    def group_sum(
+        self, key: str, value: str, rows: Optional[Iterable[int]] = None
+    ) -> dict:
+        keys, values = self.columns[key], self.columns[value]
+        if rows is not None:
+            rows = list(rows)
+            keys, values = self.take(key, rows), self.take(value, rows)
+        totals: dict = {}
+        for k, v in zip(keys, values):
+            totals[k] = totals.get(k, 0) + v
+        return totals
+
+
+_SCHEMA = {
+    "sections": {"id": "q", "created_at": "d"},
+    "sentences": {"id": "q", "section": "q", "created_at": "d"},
+    "translations": {
+        "id": "q",
+        "sentence": "q",
+        "translator": "q",
+        "is_approved": "b",
+        "created_at": "d",
+    },
+}
+
+
+def _empty_table(name: str) -> Table:
+    return Table({column: array(code) for column, code in _SCHEMA[name].items()})
+
+
+def _map_file(path: str, typecode: str):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return array(typecode) if typecode != "B" else bytearray()
+        view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    return view if typecode == "B" else view.cast(typecode)
+
+
+@dataclass
+class Snapshot:
+    """Columnar, read-mostly copy of a project's sections, sentences and translations.
+
+    Texts live in each table's string pool, rows are addressed by index.
+    Translations without a translator have -1 in the `translator` column and
+    missing timestamps are stored as NaN.
+    """
+
+    project_id: int
+    sections: Table
+    sentences: Table
+    translations: Table
+
+    @staticmethod
+    async def build(
+        project: "pytorjoman.Project",
+        page_size: int = 100,
+        concurrency: int = 8,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> "Snapshot":
+        """Crawl `project`, `on_progress` is called with counts of fetched rows."""
+        with priority("bulk"):
+            snapshot = Snapshot(
+                project.id,
+                _empty_table("sections"),
+                _empty_table("sentences"),
+                _empty_table("translations"),
+            )
+            sections = await project.list_sections()
+            for section in sections:
+                snapshot.sections["id"].append(section.id)
+                snapshot.sections["created_at"].append(_timestamp(section.created_at))
+                snapshot.sections.text.append(section.name)
+
+            sentences = [
+                sentence
+                for page in await _gather_bounded(
+                    (
+                        _all_pages(
+                            section.list_sentences, page_size, concurrency, on_progress
+                        )
+                        for section in sections
+                    ),
+                    concurrency,
+                )
+                for sentence in page
+            ]
+            for sentence in sentences:
+                snapshot.sentences["id"].append(sentence.id)
+                snapshot.sentences["section"].append(sentence.section.id)
+                snapshot.sentences["created_at"].append(_timestamp(sentence.created_at))
+                snapshot.sentences.text.append(sentence.sentence)
+
+            for page in await _gather_bounded(
+                (
+                    _all_pages(
+                        sentence.list_translations, page_size, concurrency, on_progress
+                    )
+                    for sentence in sentences
+                ),
+                concurrency,
+            ):
+                for translation in page:
+                    snapshot.translations["id"].append(translation.id)
+                    snapshot.translations["sentence"].append(translation.sentence.id)
+                    snapshot.translations["translator"].append(
+                        translation.translator.id if translation.translator else -1
+                    )
+                    snapshot.translations["is_approved"].append(translation.is_approved)
+                    snapshot.translations["created_at"].append(
+                        _timestamp(translation.created_at)
+                    )
+                    snapshot.translations.text.append(translation.translation)
+            return snapshot
+
+    def approval_by_section(self) -> dict[int, float]:
+        """Fraction of each section's sentences having an approved translation."""
+        approved = set(
+            compress(self.translations["sentence"], self.translations["is_approved"])
+        )
+        flags = [sentence in approved for sentence in self.sentences["id"]]
+        totals = self.sentences.group_count("section")
+        approved_counts = Counter(compress(self.sentences["section"], flags))
+        return {
+            section: (
+                approved_counts[section] / totals[section] if totals[section] else 0.0
+            )
+            for section in self.sections["id"]
+        }
+
+    def translations_per_translator(self) -> Counter:
+        return self.translations.group_count("translator")
+
+    def save(self, path: str) -> None:
+        """Write the snapshot as one raw file per column plus a manifest.
+
+        Columns are stored in the host's native byte order.
+        """
+        os.makedirs(path, exist_ok=True)
+        manifest = {"project_id": self.project_id, "tables": {}}
+        for name, schema in _SCHEMA.items():
+            table: Table = getattr(self, name)
+            manifest["tables"][name] = len(table.text)
+            for column, code in schema.items():
+                with open(os.path.join(path, f"{name}.{column}"), "wb") as f:
+                    f.write(array(code, table[column]).tobytes())
+            with open(os.path.join(path, f"{name}.text"), "wb") as f:
+                f.write(table.text.data)
+            with open(os.path.join(path, f"{name}.text_offsets"), "wb") as f:
+                f.write(array("Q", table.text.offsets).tobytes())
+        with open(os.path.join(path, "manifest.json"), "w") as f:
+            json.dump(manifest, f)
+
+    @staticmethod
+    def load(path: str) -> "Snapshot":
+        """Open a saved snapshot, columns are memory-mapped rather than read."""
+        with open(os.path.join(path, "manifest.json")) as f:
+            manifest = json.load(f)
+        tables = {}
+        for name, schema in _SCHEMA.items():
+            tables[name] = Table(
+                {
+                    column: _map_file(os.path.join(path, f"{name}.{column}"), code)
+                    for column, code in schema.items()
+                },
+                StringPool(
+                    _map_file(os.path.join(path, f"{name}.text"), "B"),
+                    _map_file(os.path.join(path, f"{name}.text_offsets"), "Q"),
+                ),
+            )
+        return Snapshot(manifest["project_id"], **tables)
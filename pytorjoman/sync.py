@@ -0,0 +1,202 @@
+"""Synchronous facade over the async API.
+
+Every call is run on one long-lived event loop in a background thread, so all
+synchronous callers share its connection pool::
+
+    from pytorjoman import sync
+
+    account = sync.Account.login(base_url, username, password)
+    for project in account.list_projects().results:
+        print(project.name)
+"""
+import asyncio
+import atexit
+import dataclasses
+import functools
+import inspect
+import threading
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+import pytorjoman
+from pytorjoman._backend import Model, ModelList, _gather_bounded, aclose
+from pytorjoman._backend import stats as _loop_stats
+
+
+class _LoopThread:
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self.loop.run_forever, name="pytorjoman-loop", daemon=True
+        )
+        self.thread.start()
+
+    def run(self, aw: Awaitable) -> Any:
+        return asyncio.run_coroutine_threadsafe(aw, self.loop).result()
+
+    def stop(self) -> None:
+        self.run(aclose())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+_runner: Optional[_LoopThread] = None
+_runner_lock = threading.Lock()
+
+
+def _get_runner() -> _LoopThread:
+    global _runner
+    if _runner is None:
+        with _runner_lock:
+            if _runner is None:
+                _runner = _LoopThread()
+    return _runner
+
+
+def run(aw: Awaitable) -> Any:
+    """Run a coroutine on the background loop and wait for its result."""
+    return _wrap(_get_runner().run(aw))
+
+
+def stats() -> Optional[dict]:
+    """Transport state of the background loop, None before its first request."""
+    runner = _runner
+    return _loop_stats(runner.loop) if runner is not None else None
+
+
+@atexit.register
+def shutdown() -> None:
+    """Close the connection pool and stop the background loop."""
+    global _runner
+    with _runner_lock:
+        if _runner is not None:
+            _runner.stop()
+            _runner = None
+
+
+def _wrap(value: Any) -> Any:
+    match value:
+        case Model() if type(value) in _FACADES:
+            return _FACADES[type(value)](value)
+        case ModelList():
+            return ModelList(
+                value.count, value.next, value.previous, _wrap(value.results)
+            )
+        case list():
+            return [_wrap(v) for v in value]
+        case tuple():
+            return tuple(_wrap(v) for v in value)
+        case dict():
+            return {k: _wrap(v) for k, v in value.items()}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        # results such as SyncReport or ImportReport, holding models
+        changes = {}
+        for f in dataclasses.fields(value):
+            if f.init:
+                field_value = getattr(value, f.name)
+                if (wrapped := _wrap(field_value)) is not field_value:
+                    changes[f.name] = wrapped
+        return dataclasses.replace(value, **changes) if changes else value
+    return value
+
+
+def _unwrap(value: Any) -> Any:
+    match value:
+        case _Facade():
+            return value.aio
+        case list() | tuple():
+            return type(value)(_unwrap(v) for v in value)
+    return value
+
+
+def _blocking(func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return run(func(*_unwrap(args), **{k: _unwrap(v) for k, v in kwargs.items()}))
+
+    wrapper.aio = func
+    return wrapper
+
+
+class _FacadeType(type):
+    def __getattr__(cls, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = getattr(cls._async, name)
+        return _blocking(value) if inspect.iscoroutinefunction(value) else value
+
+
+class _Facade(metaclass=_FacadeType):
+    _async: type = None
+
+    def __init__(self, obj: Model):
+        object.__setattr__(self, "aio", obj)
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self.aio, name)
+        if inspect.iscoroutinefunction(value):
+            return _blocking(value)
+        return _wrap(value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.aio, name, _unwrap(value))
+
+    def __eq__(self, other: object) -> bool:
+        return self.aio == _unwrap(other)
+
+    def __repr__(self) -> str:
+        return f"sync.{self.aio!r}"
+
+
+class Account(_Facade):
+    _async = pytorjoman.Account
+
+
+class Project(_Facade):
+    _async = pytorjoman.Project
+
+
+class Section(_Facade):
+    _async = pytorjoman.Section
+
+
+class Sentence(_Facade):
+    _async = pytorjoman.Sentence
+
+
+class Translation(_Facade):
+    _async = pytorjoman.Translation
+
+
+_FACADES = {
+    facade._async: facade
+    for facade in (Account, Project, Section, Sentence, Translation)
+}
+
+
+def gather(*aws: Awaitable, limit: int = 8, return_exceptions: bool = False) -> list:
+    """Run coroutines concurrently on the background loop, at most `limit` at once.
+
+    Coroutines come from the async objects, e.g.
+    `sync.gather(*(s.aio.list_translations() for s in sentences))`.
+    """
+    return run(_gather_bounded(aws, limit, return_exceptions))
+
+
+def batch(
+    func: Callable,
+    items: Iterable,
+    limit: int = 8,
+    return_exceptions: bool = False,
+) -> list:
+    """Call `func` on every item concurrently and return the results in order.
+
+    `func` is a facade method such as `section.create_sentence` or any
+    coroutine function, this is safe to call from several threads at once.
+    """
+    func = getattr(func, "aio", func)
+    return gather(
+        *(func(_unwrap(item)) for item in items),
+        limit=limit,
+        return_exceptions=return_exceptions,
+    )
@@ -4,7 +4,7 @@ from typing import Optional
 from urllib import parse
 
 import pytorjoman
-from pytorjoman._backend import Model, ModelList, _call
+from pytorjoman._backend import Model, ModelList, _call, _fetch_many
 from pytorjoman.errors import (
     AlreadyExistError,
     NotFoundError,
@@ -130,43 +130,107 @@ class Translation(Model):
                 raise UnknownError()
 
     @staticmethod
-    async def get_translation(base_url: str, token: str, translation: int):
+    async def _get_json(base_url: str, translation: int) -> dict:
         status, res = await _call(
             f"{base_url}/api/v1/translations/{translation}", "GET", with_auth=False
         )
         match status:
             case 200:
-                return Translation(
-                    base_url,
-                    "translations",
-                    token,
-                    res["id"],
-                    (
-                        Owner(res["translator"]["id"], res["translator"]["first_name"])
-                        if res.get("translator")
-                        else None
-                    ),
-                    pytorjoman.Sentence(
-                        base_url,
-                        "sentences",
-                        token,
-                        res["sentence"]["id"],
-                        await pytorjoman.Section.get_section(
-                            base_url, token, res["sentence"]["section"]
-                        ),
-                        res["sentence"]["sentence"],
-                        res["sentence"]["created_at"],
-                    ),
-                    res["translation"],
-                    [Owner(v["id"], v["first_name"]) for v in res["voters"]],
-                    res["is_approved"],
-                    res["created_at"],
-                )
+                return res
             case 404:
                 raise NotFoundError("Translation not found")
             case _:
                 raise UnknownError()
 
+    @staticmethod
+    def _from_json(
+        base_url: str, token: str, res: dict, sentence: pytorjoman.Sentence
+    ) -> "Translation":
+        return Translation(
+            base_url,
+            "translations",
+            token,
+            res["id"],
+            (
+                Owner(res["translator"]["id"], res["translator"]["first_name"])
+                if res.get("translator")
+                else None
+            ),
+            sentence,
+            res["translation"],
+            [Owner(v["id"], v["first_name"]) for v in res["voters"]],
+            res["is_approved"],
+            res["created_at"],
+        )
+
+    @staticmethod
+    async def get_translation(base_url: str, token: str, translation: int):
+        res = await Translation._get_json(base_url, translation)
+        return Translation._from_json(
+            base_url,
+            token,
+            res,
+            pytorjoman.Sentence(
+                base_url,
+                "sentences",
+                token,
+                res["sentence"]["id"],
+                await pytorjoman.Section.get_section(
+                    base_url, token, res["sentence"]["section"]
+                ),
+                res["sentence"]["sentence"],
+                res["sentence"]["created_at"],
+            ),
+        )
+
+    @staticmethod
+    async def get_many(
+        base_url: str, token: str, translations: list[int], concurrency: int = 16
+    ) -> list["Translation | Exception"]:
+        """Get translations by id, in order, with the error instead of a failed one.
+
+        Every section and project is fetched once however many of the
+        translations share it, translations of one sentence share its object.
+        """
+        found = await _fetch_many(
+            translations,
+            lambda translation: Translation._get_json(base_url, translation),
+            concurrency,
+        )
+        sections = await pytorjoman.Section._get_many(
+            base_url,
+            token,
+            (
+                res["sentence"]["section"]
+                for res in found.values()
+                if isinstance(res, dict)
+            ),
+            concurrency,
+        )
+        sentences: dict[int, pytorjoman.Sentence] = {}
+        for translation, res in found.items():
+            if isinstance(res, Exception):
+                continue
+            section = sections[res["sentence"]["section"]]
+            if isinstance(section, Exception):
+                found[translation] = section
+                continue
+            s = res["sentence"]
+            if s["id"] not in sentences:
+                sentences[s["id"]] = pytorjoman.Sentence(
+                    base_url,
+                    "sentences",
+                    token,
+                    s["id"],
+                    section,
+                    s["sentence"],
+                    s["created_at"],
+                )
+            found[translation] = Translation._from_json(
+                base_url, token, res, sentences[s["id"]]
+            )
+        return [found[translation] for translation in translations]
+
     async def get_voters(self):
         status, res = await self._call(
             f"{self.id}",
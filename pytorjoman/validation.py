@@ -0,0 +1,235 @@
+import asyncio
+import os
+import re
+from collections import Counter, deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import AsyncIterator, Callable, Iterable, Optional
+
+import pytorjoman
+from pytorjoman._backend import priority
+from pytorjoman.search import normalize
+
+# a check gets the source sentence, its translation and the sentence's id and
+# returns a problem description or None, checks run in worker processes so
+# must be picklable
+Check = Callable[[str, str, int], Optional[str]]
+
+# printf's space flag is left out, "50% discount" is prose, not "% d"
+_PLACEHOLDER = re.compile(
+    r"\{\{?\s*[\w.]*\s*\}\}?|%(?:\d+\$|\([\w.]+\))?[-+#0]*\d*(?:\.\d+)?[sdifxXeEgGcr%]"
+)
+_NUMBER = re.compile(r"\d+")
+# embeddings and overrides are closed by PDF, isolates by PDI
+_OPENERS = {
+    "\u202a": "\u202c",
+    "\u202b": "\u202c",
+    "\u202d": "\u202c",
+    "\u202e": "\u202c",
+    "\u2066": "\u2069",
+    "\u2067": "\u2069",
+    "\u2068": "\u2069",
+}
+_CLOSERS = set(_OPENERS.values())
+
+
+def placeholders(source: str, target: str, sentence_id: int = 0) -> Optional[str]:
+    missing = Counter(_PLACEHOLDER.findall(source))
+    missing.subtract(_PLACEHOLDER.findall(target))
+    if any(missing.values()):
+        return (
+            f"placeholders differ, missing {sorted((+missing).elements())}"
+            f" unexpected {sorted((-missing).elements())}"
+        )
+    return None
+
+
+def numbers(source: str, target: str, sentence_id: int = 0) -> Optional[str]:
+    # int() understands Arabic-Indic digits as well
+    missing = Counter(map(int, _NUMBER.findall(source)))
+    missing.subtract(map(int, _NUMBER.findall(target)))
+    if any(missing.values()):
+        return (
+            f"numbers differ, missing {sorted((+missing).elements())}"
+            f" unexpected {sorted((-missing).elements())}"
+        )
+    return None
+
+
+def bidi_controls(source: str, target: str, sentence_id: int = 0) -> Optional[str]:
+    stack = []
+    for c in target:
+        if c in _OPENERS:
+            stack.append(_OPENERS[c])
+        elif c in _CLOSERS:
+            if not stack or stack.pop() != c:
+                return f"unbalanced bidi control U+{ord(c):04X}"
+    if stack:
+        return "unterminated bidi embedding or isolate"
+    return None
+
+
+@dataclass
+class LengthRatio:
+    low: float = 0.3
+    high: float = 3.0
+
+    def __call__(self, source: str, target: str, sentence_id: int = 0) -> Optional[str]:
+        ratio = len(target) / max(len(source), 1)
+        if not self.low <= ratio <= self.high:
+            return f"length ratio {ratio:.2f} outside {self.low}-{self.high}"
+        return None
+
+
+@dataclass
+class Duplicates:
+    """Reject translations their sentence already has, compared after normalization.
+
+    `existing` maps sentence ids to their translations' texts.
+    """
+
+    existing: dict[int, set[str]] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.existing = {
+            sentence: {normalize(t) for t in texts}
+            for sentence, texts in self.existing.items()
+        }
+
+    @staticmethod
+    def from_translations(
+        translations: Iterable["pytorjoman.Translation"],
+    ) -> "Duplicates":
+        existing: dict[int, set[str]] = {}
+        for t in translations:
+            existing.setdefault(t.sentence.id, set()).add(t.translation)
+        return Duplicates(existing)
+
+    def __call__(self, source: str, target: str, sentence_id: int = 0) -> Optional[str]:
+        if normalize(target) in self.existing.get(sentence_id, ()):
+            return "duplicate of an existing translation"
+        return None
+
+
+DEFAULT_CHECKS: tuple[Check, ...] = (
+    placeholders,
+    numbers,
+    bidi_controls,
+    LengthRatio(),
+)
+
+
+# set in each worker of the pool submit_translations creates, so the checks,
+# and data such as Duplicates.existing, are sent once rather than per batch
+_checks: tuple[Check, ...] = ()
+
+
+def _install(checks: tuple[Check, ...]) -> None:
+    global _checks
+    _checks = checks
+
+
+def _validate(
+    items: list[tuple[str, str, int]], checks: Optional[tuple[Check, ...]] = None
+) -> list[list[str]]:
+    checks = _checks if checks is None else checks
+    return [
+        [problem for check in checks if (problem := check(*item))] for item in items
+    ]
+
+
+@dataclass
+class ValidationResult:
+    sentence: "pytorjoman.Sentence"
+    translation: str
+    problems: list[str]
+    created: Optional["pytorjoman.Translation"] = None
+    error: Optional[Exception] = None
+
+
+async def submit_translations(
+    items: Iterable[tuple["pytorjoman.Sentence", str]],
+    checks: Iterable[Check] = DEFAULT_CHECKS,
+    batch_size: int = 500,
+    concurrency: int = 8,
+    processes: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    dry_run: bool = False,
+) -> AsyncIterator[ValidationResult]:
+    """Validate translations in a process pool and create those that pass.
+
+    Batches are validated in `executor`, a ProcessPoolExecutor with
+    `processes` workers by default, while translations from earlier batches
+    are being uploaded. Results are yielded as they are ready: rejected ones
+    with their `problems`, uploaded ones with `created` or the `error` the
+    server answered with. The default pool receives the checks once per
+    worker, a given `executor` with every batch.
+    """
+    checks = tuple(checks)
+    loop = asyncio.get_running_loop()
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(
+            processes, initializer=_install, initargs=(checks,)
+        )
+    # sent with every batch when the workers don't have them installed
+    batch_checks = None if own_executor else checks
+    # batches validating at once, enough to keep every worker busy
+    window = 2 * (processes or os.cpu_count() or 1)
+    results: asyncio.Queue[Optional[ValidationResult]] = asyncio.Queue()
+    slots = asyncio.Semaphore(concurrency)
+
+    async def upload(result: ValidationResult) -> None:
+        try:
+            with priority("bulk"):
+                result.created = await result.sentence.create_translation(
+                    result.translation
+                )
+        except Exception as e:
+            result.error = e
+        finally:
+            slots.release()
+            await results.put(result)
+
+    async def dispatch(batch, validation) -> list[asyncio.Task]:
+        uploads = []
+        for (sentence, translation), problems in zip(batch, await validation):
+            result = ValidationResult(sentence, translation, problems)
+            if problems or dry_run:
+                await results.put(result)
+            else:
+                await slots.acquire()
+                uploads.append(asyncio.create_task(upload(result)))
+        return uploads
+
+    async def produce() -> None:
+        uploads: list[asyncio.Task] = []
+        validating: deque = deque()
+        items_iter = iter(items)
+        try:
+            while batch := list(islice(items_iter, batch_size)):
+                rows = [(s.sentence, text, s.id) for s, text in batch]
+                validating.append(
+                    (
+                        batch,
+                        loop.run_in_executor(executor, _validate, rows, batch_checks),
+                    )
+                )
+                if len(validating) >= window:
+                    uploads += await dispatch(*validating.popleft())
+            while validating:
+                uploads += await dispatch(*validating.popleft())
+            await asyncio.gather(*uploads)
+        finally:
+            await results.put(None)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while (result := await results.get()) is not None:
+            yield result
+        await producer
+    finally:
+        producer.cancel()
+        if own_executor:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,236 @@
+import asyncio
+import itertools
+import json
+from typing import Callable, Optional
+
+import httpx
+import pytest
+
+from pytorjoman import _backend
+
+BASE_URL = "http://torjoman.test"
+TOKEN = "token"
+
+
+class FakeServer:
+    """In-memory stand-in for the Torjoman API, served over httpx.MockTransport.
+
+    One account logs in as "user" with "secret", `tokens` maps the access
+    tokens it accepts to their refresh token, `expire()` invalidates them.
+    Every request is kept in `requests`. `fault`, when set, is called with
+    each request first and may answer it instead, e.g. with a 502, or raise.
+    Answers take `delay` seconds.
+    """
+
+    def __init__(self):
+        self.projects = {
+            1: {
+                "id": 1,
+                "owner": {"id": 1, "first_name": "owner"},
+                "name": "project",
+                "created_at": "2023-01-01T00:00:00",
+            }
+        }
+        self.sections = {
+            1: {
+                "id": 1,
+                "project": 1,
+                "name": "section",
+                "created_at": "2023-01-01T00:00:00",
+            }
+        }
+        self.tokens = {TOKEN: "refresh"}
+        self.sentences: dict[int, dict] = {}
+        self.translations: dict[int, dict] = {}
+        self.requests: list[httpx.Request] = []
+        self.fault: Optional[Callable[[httpx.Request], Optional[httpx.Response]]] = None
+        self.delay = 0.0
+        self._ids = itertools.count(1)
+
+    def add_sentence(self, text: str, section: int = 1) -> dict:
+        sentence = {
+            "id": next(self._ids),
+            "section": section,
+            "sentence": text,
+            "created_at": "2023-01-01T00:00:00",
+        }
+        self.sentences[sentence["id"]] = sentence
+        return sentence
+
+    def add_translation(self, sentence: int, text: str) -> dict:
+        translation = {
+            "id": next(self._ids),
+            "sentence": sentence,
+            "translation": text,
+            "translator": {"id": 1, "first_name": "owner"},
+            "voters": [],
+            "is_approved": False,
+            "created_at": "2023-01-01T00:00:00",
+        }
+        self.translations[translation["id"]] = translation
+        return translation
+
+    def expire(self) -> None:
+        """Expire the access tokens, leaving their refresh tokens usable."""
+        self.tokens = {f"expired {access}": r for access, r in self.tokens.items()}
+
+    def _account(self, access: str) -> dict:
+        return {
+            "id": 1,
+            "first_name": "owner",
+            "last_name": "",
+            "email": "owner@torjoman.test",
+            "username": "user",
+            "send_time": "09:00:00",
+            "number_of_words": 10,
+            "tokens": {"access": access, "refresh": self.tokens[access]},
+        }
+
+    def count(self, method: str, path: str) -> int:
+        return sum(
+            1 for r in self.requests if r.method == method and r.url.path == path
+        )
+
+    def _page(self, items: list[dict], params: httpx.QueryParams) -> dict:
+        page, size = int(params.get("page", 1)), int(params.get("page_size", 25))
+        return {
+            "count": len(items),
+            "next": None,
+            "previous": None,
+            "results": items[(page - 1) * size : page * size],
+        }
+
+    def handle(self, request: httpx.Request):
+        self.requests.append(request)
+        if self.fault is not None and (res := self.fault(request)) is not None:
+            return res
+        if self.delay:
+            return self._later(request)
+        return self._respond(request)
+
+    async def _later(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(self.delay)
+        return self._respond(request)
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        parts = request.url.path.split("/")[3:]
+        body = json.loads(request.content) if request.content else {}
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        match request.method, parts:
+            case "POST", ["accounts", "login"]:
+                if body != {"username": "user", "password": "secret"}:
+                    return httpx.Response(401, json={})
+                found = self._account(TOKEN)
+            case "GET", ["accounts", ""]:
+                if token not in self.tokens:
+                    return httpx.Response(401, json={})
+                found = self._account(token)
+            case "GET", ["accounts", "refresh", refresh]:
+                if refresh not in self.tokens.values():
+                    return httpx.Response(401, json={})
+                access = f"renewed {len(self.tokens)}"
+                self.tokens[access] = f"{refresh} renewed"
+                found = {"access": access, "refresh": self.tokens[access]}
+            case "GET", ["projects", id]:
+                found = self.projects.get(int(id))
+            case "GET", ["sections", ""]:
+                project = int(request.url.params["project"])
+                found = [s for s in self.sections.values() if s["project"] == project]
+            case "PUT", ["sections", "update"] if "new_name" in body:
+                found = self.sections.get(body["id"])
+                if found is not None:
+                    found["name"] = body["new_name"]
+            case "GET", ["sections", id]:
+                found = self.sections.get(int(id))
+            case "GET", ["sentences", ""]:
+                section = int(request.url.params["section"])
+                found = self._page(
+                    [s for s in self.sentences.values() if s["section"] == section],
+                    request.url.params,
+                )
+            case "GET", ["sentences", "for-user"]:
+                params = request.url.params
+                if "section" in params:
+                    sections = {int(params["section"])}
+                else:
+                    project = int(params["project"])
+                    sections = {
+                        s["id"]
+                        for s in self.sections.values()
+                        if s["project"] == project
+                    }
+                found = [
+                    {
+                        **s,
+                        "translations": [
+                            t["translation"]
+                            for t in self.translations.values()
+                            if t["sentence"] == s["id"]
+                        ],
+                    }
+                    for s in self.sentences.values()
+                    if s["section"] in sections
+                ]
+            case "GET", ["sentences", id]:
+                found = self.sentences.get(int(id))
+            case "POST", ["sentences", ""]:
+                if any(
+                    s["section"] == body["section_id"]
+                    and s["sentence"] == body["sentence"]
+                    for s in self.sentences.values()
+                ):
+                    return httpx.Response(409, json={})
+                found = self.add_sentence(body["sentence"], body["section_id"])
+            case "PUT", ["sentences", "update"] if "new_sentence" in body:
+                found = self.sentences.get(body["id"])
+                if found is not None:
+                    found["sentence"] = body["new_sentence"]
+            case "GET", ["translations", ""]:
+                sentence = int(request.url.params["sentence"])
+                found = self._page(
+                    [
+                        t
+                        for t in self.translations.values()
+                        if t["sentence"] == sentence
+                    ],
+                    request.url.params,
+                )
+            case "GET", ["translations", id]:
+                found = self.translations.get(int(id))
+                if found is not None:
+                    found = {
+                        **found,
+                        "sentence": self.sentences[found["sentence"]],
+                    }
+            case "POST", ["translations", ""]:
+                if any(
+                    t["sentence"] == body["sentence_id"]
+                    and t["translation"] == body["translation"]
+                    for t in self.translations.values()
+                ):
+                    return httpx.Response(409, json={})
+                found = self.add_translation(body["sentence_id"], body["translation"])
+            case "PUT", [_, "update"]:
+                # the API validates the body against the controller's schema
+                return httpx.Response(422, json={})
+            case _:
+                found = None
+        if found is None:
+            return httpx.Response(404, json={})
+        return httpx.Response(200, json=found)
+
+
+@pytest.fixture(autouse=True)
+def _reset_backend():
+    config = {**_backend._config}
+    yield
+    _backend._config.clear()
+    _backend._config.update(config)
+    _backend._transports.clear()
+
+
+@pytest.fixture
+def server() -> FakeServer:
+    server = FakeServer()
+    _backend.configure(transport=httpx.MockTransport(server.handle))
+    return server
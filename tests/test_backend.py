@@ -0,0 +1,131 @@
+import asyncio
+import gc
+
+import pytest
+from conftest import BASE_URL, TOKEN
+
+from pytorjoman import Project, _backend
+from pytorjoman._backend import _Scheduler, priority
+
+
+def test_repeated_asyncio_run_closes_pools(server):
+    clients = []
+
+    async def get():
+        project = await Project.get_project(BASE_URL, TOKEN, 1)
+        clients.append(_backend._transport().client)
+        return project
+
+    for _ in range(20):
+        assert asyncio.run(get()).name == "project"
+    gc.collect()
+    assert all(client.is_closed for client in clients)
+    assert len(_backend._transports) <= 1
+
+
+def test_closed_loop_entries_are_dropped(server):
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(Project.get_project(BASE_URL, TOKEN, 1))
+    # closed without finalizing its async generators, unlike asyncio.run()
+    loop.close()
+    assert loop in _backend._transports
+    asyncio.run(Project.get_project(BASE_URL, TOKEN, 1))
+    assert loop not in _backend._transports
+
+
+def test_aclose_closes_the_pool(server):
+    async def main():
+        await Project.get_project(BASE_URL, TOKEN, 1)
+        client = _backend._transport().client
+        await _backend.aclose()
+        assert client.is_closed
+        await Project.get_project(BASE_URL, TOKEN, 1)
+
+    asyncio.run(main())
+
+
+def test_scheduler_favours_interactive_requests():
+    order = []
+
+    async def job(scheduler, name):
+        await scheduler.acquire(name)
+        order.append(name)
+        await asyncio.sleep(0.001)
+        scheduler.release()
+
+    async def main():
+        scheduler = _Scheduler(2, {"interactive": 8, "bulk": 1})
+        bulk = [asyncio.create_task(job(scheduler, "bulk")) for _ in range(20)]
+        await asyncio.sleep(0)
+        interactive = [
+            asyncio.create_task(job(scheduler, "interactive")) for _ in range(8)
+        ]
+        await asyncio.gather(*bulk, *interactive)
+        assert scheduler.in_flight == 0
+
+    asyncio.run(main())
+    # all interactive requests are served well before the bulk backlog
+    assert max(i for i, name in enumerate(order) if name == "interactive") < 14
+
+
+def test_cancelled_waiter_gives_its_slot_back():
+    async def main():
+        scheduler = _Scheduler(1, {"interactive": 1})
+        await scheduler.acquire("interactive")
+        waiter = asyncio.create_task(scheduler.acquire("interactive"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        scheduler.release()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert scheduler.in_flight == 0
+
+    asyncio.run(main())
+
+
+def test_priority_is_inherited_by_tasks(server, monkeypatch):
+    seen = []
+    scheduler_acquire = _Scheduler.acquire
+
+    async def acquire(self, name):
+        seen.append(name)
+        await scheduler_acquire(self, name)
+
+    async def main():
+        with priority("bulk"):
+            await asyncio.gather(
+                asyncio.create_task(Project.get_project(BASE_URL, TOKEN, 1))
+            )
+        await Project.get_project(BASE_URL, TOKEN, 1)
+
+    monkeypatch.setattr(_Scheduler, "acquire", acquire)
+    asyncio.run(main())
+    assert seen == ["bulk", "interactive"]
+
+
+def test_stats_is_read_only(server):
+    async def main():
+        assert _backend.stats() is None
+        assert not _backend._transports
+        await Project.get_project(BASE_URL, TOKEN, 1)
+        return _backend.stats()
+
+    stats = asyncio.run(main())
+    assert stats["in_flight"] == stats["queued"] == 0
+    other = asyncio.new_event_loop()
+    try:
+        assert _backend.stats(other) is None
+    finally:
+        other.close()
+    assert len(_backend._transports) == 1
+
+
+def test_stats_of_the_sync_facade(server):
+    from pytorjoman import sync
+
+    try:
+        assert sync.stats() is None
+        sync.Project.get_project(BASE_URL, TOKEN, 1)
+        assert sync.stats()["in_flight"] == 0
+    finally:
+        sync.shutdown()
@@ -0,0 +1,114 @@
+import asyncio
+from collections import Counter
+
+import httpx
+import pytest
+from conftest import BASE_URL, TOKEN
+
+from pytorjoman import Project, Section, Sentence, _backend, configure
+from pytorjoman._backend import _gather_bounded
+
+REPLICAS = ["http://r1.test", "http://r2.test", "http://r3.test"]
+
+
+@pytest.fixture
+def replicas(server):
+    configure(replicas={BASE_URL: REPLICAS})
+    yield server
+    _backend._pins.clear()
+
+
+def _hosts(server) -> Counter:
+    return Counter(request.url.host for request in server.requests)
+
+
+def test_reads_are_spread_over_replicas(replicas):
+    replicas.delay = 0.01
+
+    async def main():
+        await _gather_bounded(
+            (Project.get_project(BASE_URL, TOKEN, 1) for _ in range(60)), 30
+        )
+
+    asyncio.run(main())
+    hosts = _hosts(replicas)
+    assert set(hosts) == {"r1.test", "r2.test", "r3.test"}
+
+
+def test_base_url_matches_on_a_boundary(replicas):
+    asyncio.run(Project.get_project(f"{BASE_URL}server", TOKEN, 1))
+    assert _hosts(replicas) == {"torjoman.testserver": 1}
+
+
+def test_failed_replica_is_skipped(replicas):
+    def down(request):
+        if request.url.host == "r1.test":
+            raise httpx.ConnectError("down", request=request)
+
+    replicas.fault = down
+
+    async def main():
+        projects = await _gather_bounded(
+            (Project.get_project(BASE_URL, TOKEN, 1) for _ in range(30)), 10
+        )
+        balancer = _backend._transport().balancers[BASE_URL]
+        return projects, balancer.replicas["http://r1.test"].open
+
+    projects, tripped = asyncio.run(main())
+    assert all(project.name == "project" for project in projects)
+    assert tripped
+    assert _hosts(replicas)["r1.test"] <= _backend._Balancer.failure_threshold + 1
+
+
+def test_reads_follow_writes_across_calls(replicas):
+    async def write():
+        section = await Section.get_section(BASE_URL, TOKEN, 1)
+        # in a task of its own, as bulk helpers do
+        [sentence] = await _gather_bounded([section.create_sentence("a")], 1)
+        return sentence.id
+
+    sentence = asyncio.run(write())
+    [written] = [r.url.host for r in replicas.requests if r.method == "POST"]
+    replicas.requests.clear()
+    asyncio.run(Sentence.get_sentence(BASE_URL, TOKEN, sentence))
+    assert set(_hosts(replicas)) == {written}
+
+
+def test_other_tokens_stay_balanced_while_writing(replicas):
+    replicas.delay = 0.01
+
+    async def main():
+        section = await Section.get_section(BASE_URL, TOKEN, 1)
+        await section.create_sentence("first")
+        writes = _gather_bounded(
+            (section.create_sentence(str(n)) for n in range(30)), 10
+        )
+        reads = _gather_bounded(
+            (Project.get_project(BASE_URL, "reader", 1) for _ in range(60)), 30
+        )
+        await asyncio.gather(writes, reads)
+
+    asyncio.run(main())
+    posts = Counter(r.url.host for r in replicas.requests if r.method == "POST")
+    reads = Counter(
+        r.url.host
+        for r in replicas.requests
+        if r.url.path.startswith("/api/v1/projects")
+    )
+    assert len(posts) > 1
+    assert set(reads) == {"r1.test", "r2.test", "r3.test"}
+
+
+def test_pins_are_bounded(replicas, monkeypatch):
+    monkeypatch.setattr(_backend._Balancer, "max_pins", 3)
+
+    async def main():
+        section = await Section.get_section(BASE_URL, TOKEN, 1)
+        for n in range(5):
+            writer = Section(
+                BASE_URL, "sections", f"token{n}", 1, section.project, "", ""
+            )
+            await writer.create_sentence(str(n))
+
+    asyncio.run(main())
+    assert [token for _, token in _backend._pins] == ["token2", "token3", "token4"]
@@ -0,0 +1,104 @@
+import json
+
+import pytest
+from conftest import BASE_URL, TOKEN
+
+from pytorjoman import cli
+
+
+@pytest.fixture
+def cache(server, tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "token.json"
+    monkeypatch.setattr(cli, "CACHE", str(path))
+    return path
+
+
+@pytest.fixture
+def logged_in(server, cache):
+    cli.main(["login", BASE_URL, "user", "--password", "secret"])
+    return server
+
+
+def test_login_caches_the_tokens(server, cache, capsys):
+    cli.main(["login", f"{BASE_URL}/", "user", "--password", "secret"])
+    assert capsys.readouterr().out == "logged in as user\n"
+    assert json.loads(cache.read_text()) == {
+        "base_url": BASE_URL,
+        "access": TOKEN,
+        "refresh": "refresh",
+    }
+    assert cache.stat().st_mode & 0o777 == 0o600
+
+
+def test_commands_need_a_login(server, cache):
+    with pytest.raises(SystemExit, match="not logged in"):
+        cli.main(["sections", "1"])
+
+
+def test_expired_token_is_refreshed(logged_in, cache, capsys):
+    logged_in.expire()
+    cli.main(["sections", "1"])
+    assert capsys.readouterr().out == "1\tsection\n"
+    cached = json.loads(cache.read_text())
+    assert cached["access"] in logged_in.tokens
+    assert cached["refresh"] == "refresh renewed"
+    assert logged_in.count("GET", "/api/v1/accounts/refresh/refresh") == 1
+    # the renewed token is used from then on
+    cli.main(["sections", "1"])
+    assert logged_in.count("GET", "/api/v1/accounts/refresh/refresh") == 1
+
+
+def test_import_and_sync(logged_in, tmp_path, capsys):
+    lines = tmp_path / "sentences.txt"
+    lines.write_text("a\nb\n\na\n", encoding="utf-8")
+    cli.main(["import", "1", str(lines)])
+    captured = capsys.readouterr()
+    assert captured.out == "created 2 of 3 sentences\n"
+    assert "failed: AlreadyExistError()" in captured.err
+
+    lines.write_text("a\nB\nc\n", encoding="utf-8")
+    cli.main(["sync", "1", str(lines), "--page-size", "2"])
+    out = capsys.readouterr().out
+    assert out == "1 unchanged, 1 updated, 1 created, 0 left over, 0 failed\n"
+    assert [s["sentence"] for s in logged_in.sentences.values()] == ["a", "B", "c"]
+
+
+def test_import_translations(logged_in, tmp_path, capsys):
+    sentence = logged_in.add_sentence("Hello")["id"]
+    pairs = tmp_path / "pairs.tsv"
+    pairs.write_text("hello\tمرحبا\nhelo!\tأهلا\nbye\tوداعا\n", encoding="utf-8")
+    cli.main(["import-translations", "1", str(pairs), "--fuzzy", "0.8"])
+    captured = capsys.readouterr()
+    assert captured.out == (
+        "2 created (1 fuzzy), 0 already present, 1 unmatched, 0 failed\n"
+    )
+    assert "unmatched: bye\tوداعا" in captured.err
+    assert sorted(
+        t["translation"]
+        for t in logged_in.translations.values()
+        if t["sentence"] == sentence
+    ) == ["أهلا", "مرحبا"]
+
+
+def test_export(logged_in, tmp_path, capsys):
+    sentence = logged_in.add_sentence("Hello")["id"]
+    translation = logged_in.add_translation(sentence, "مرحبا")
+    translation["is_approved"] = True
+    logged_in.add_sentence("Bye")
+    output = tmp_path / "export.jsonl"
+    cli.main(["export", "1", str(output)])
+    assert capsys.readouterr().out == f"exported 2 sentences to {output}\n"
+    lines = output.read_text("utf-8").splitlines()
+    # written as is rather than \u escaped
+    assert "مرحبا" in lines[0]
+    assert [json.loads(line) for line in lines] == [
+        {
+            "id": sentence,
+            "section": 1,
+            "sentence": "Hello",
+            "translations": [
+                {"id": translation["id"], "translation": "مرحبا", "is_approved": True}
+            ],
+        },
+        {"id": sentence + 2, "section": 1, "sentence": "Bye", "translations": []},
+    ]
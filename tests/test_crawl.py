@@ -0,0 +1,89 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from conftest import BASE_URL, TOKEN
+
+from pytorjoman import Project
+from pytorjoman.crawl import CrawlCoordinator, work
+from pytorjoman.errors import TokenExpiredError
+
+
+def _plan(server, path, sentences: int = 5) -> None:
+    for n in range(sentences):
+        server.add_sentence(f"sentence {n}")
+
+    async def main():
+        project = await Project.get_project(BASE_URL, TOKEN, 1)
+        coordinator = CrawlCoordinator(path)
+        await coordinator.plan(project, page_size=2)
+        coordinator.close()
+
+    asyncio.run(main())
+
+
+def test_work_crawls_every_page(server, tmp_path):
+    path = str(tmp_path / "queue.db")
+    _plan(server, path)
+    done = asyncio.run(work(path, BASE_URL, TOKEN, str(tmp_path / "out")))
+    assert done == 3
+    lines = [
+        json.loads(line)
+        for page in (tmp_path / "out" / "1").iterdir()
+        for line in page.read_text().splitlines()
+    ]
+    assert sorted(line["sentence"] for line in lines) == [
+        f"sentence {n}" for n in range(5)
+    ]
+    coordinator = CrawlCoordinator(path)
+    assert coordinator.progress() == {"done": 3}
+
+
+def test_exhausted_tasks_are_failed_with_their_error(server, tmp_path):
+    path = str(tmp_path / "queue.db")
+    _plan(server, path)
+    server.fault = lambda request: (
+        httpx.Response(500, json={}) if request.url.params.get("page") == "2" else None
+    )
+    asyncio.run(work(path, BASE_URL, TOKEN, str(tmp_path / "out")))
+    coordinator = CrawlCoordinator(path)
+    assert coordinator.progress() == {"done": 2, "failed": 1}
+    [(section, page, attempts, error)] = coordinator.failures()
+    assert (section, page, attempts) == (1, 2, coordinator.max_attempts)
+    assert "UnknownError" in error
+
+
+def test_expired_token_stops_the_worker(server, tmp_path):
+    path = str(tmp_path / "queue.db")
+    _plan(server, path)
+    server.fault = lambda request: (
+        httpx.Response(401, json={})
+        if request.url.path == "/api/v1/sentences/"
+        else None
+    )
+    with pytest.raises(TokenExpiredError):
+        asyncio.run(work(path, BASE_URL, TOKEN, str(tmp_path / "out")))
+    coordinator = CrawlCoordinator(path)
+    assert coordinator.progress() == {"pending": 3}
+    assert coordinator.claim("other") is not None
+
+
+def test_leases_are_renewed_while_working(server, tmp_path):
+    path = str(tmp_path / "queue.db")
+    _plan(server, path, sentences=2)
+    server.delay = 0.1
+
+    async def main():
+        crawl = asyncio.create_task(
+            work(path, BASE_URL, TOKEN, str(tmp_path / "out"), lease_seconds=0.03)
+        )
+        await asyncio.sleep(0.05)
+        # the lease would have expired by now without renewal
+        other = CrawlCoordinator(path, lease_seconds=0.03)
+        stolen = other.claim("other")
+        other.close()
+        return stolen, await crawl
+
+    stolen, done = asyncio.run(main())
+    assert stolen is None and done == 1
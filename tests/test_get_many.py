@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+from conftest import BASE_URL, TOKEN
+
+from pytorjoman import Account, Project, Section, Sentence, Translation
+from pytorjoman.errors import NotFoundError
+
+
+@pytest.fixture
+def orphans(server):
+    """Section 2 belongs to a project that doesn't exist."""
+    server.sections[2] = {
+        "id": 2,
+        "project": 99,
+        "name": "orphan",
+        "created_at": "2023-01-01T00:00:00",
+    }
+    return server
+
+
+def test_projects(server):
+    projects = asyncio.run(Project.get_many(BASE_URL, TOKEN, [1, 99, 1]))
+    assert projects[0].id == projects[2].id == 1
+    assert isinstance(projects[1], NotFoundError)
+    assert server.count("GET", "/api/v1/projects/1") == 1
+
+
+def test_sections(orphans):
+    sections = asyncio.run(Section.get_many(BASE_URL, TOKEN, [2, 1, 3]))
+    assert isinstance(sections[0], NotFoundError)
+    assert sections[1].id == 1 and sections[1].project.id == 1
+    assert isinstance(sections[2], NotFoundError)
+
+
+def test_sentences(orphans):
+    a = orphans.add_sentence("a")["id"]
+    b = orphans.add_sentence("b")["id"]
+    orphan = orphans.add_sentence("c", section=2)["id"]
+    ids = [b, 999, orphan, a, b]
+    sentences = asyncio.run(Sentence.get_many(BASE_URL, TOKEN, ids))
+    assert [s.id for s in sentences if not isinstance(s, Exception)] == [b, a, b]
+    # a missing id and a sentence whose section failed, only those
+    assert isinstance(sentences[1], NotFoundError)
+    assert isinstance(sentences[2], NotFoundError)
+    assert sentences[0].section is sentences[3].section
+    assert orphans.count("GET", f"/api/v1/sentences/{b}") == 1
+    assert orphans.count("GET", "/api/v1/sections/1") == 1
+
+
+def test_translations(orphans):
+    sentence = orphans.add_sentence("a")["id"]
+    first = orphans.add_translation(sentence, "أ")["id"]
+    second = orphans.add_translation(sentence, "ا")["id"]
+    orphan = orphans.add_translation(orphans.add_sentence("b", 2)["id"], "ب")["id"]
+    ids = [second, orphan, first, 999]
+    translations = asyncio.run(Translation.get_many(BASE_URL, TOKEN, ids))
+    assert translations[0].translation == "ا"
+    assert translations[2].translation == "أ"
+    assert translations[0].sentence is translations[2].sentence
+    assert translations[0].sentence.section.id == 1
+    assert isinstance(translations[1], NotFoundError)
+    assert isinstance(translations[3], NotFoundError)
+
+
+def _account() -> Account:
+    return Account(
+        BASE_URL, "accounts", TOKEN, 1, "a", "b", "c", "d", None, 10, "refresh"
+    )
+
+
+def test_sentences_for_user(orphans):
+    first = orphans.add_sentence("a")["id"]
+    orphans.add_translation(first, "أ")
+    second = orphans.add_sentence("b")["id"]
+
+    found = asyncio.run(_account().get_sentences_for_user(project=1))
+    assert [item["sentence"].id for item in found] == [first, second]
+    assert [item["translations"] for item in found] == [["أ"], []]
+    assert found[0]["sentence"].section is found[1]["sentence"].section
+    assert found[0]["sentence"].section.project.id == 1
+    assert orphans.count("GET", "/api/v1/sections/1") == 1
+    assert orphans.count("GET", "/api/v1/projects/1") == 1
+
+
+def test_sentences_for_user_with_a_missing_section(orphans):
+    orphans.add_sentence("c", section=2)
+    with pytest.raises(NotFoundError):
+        asyncio.run(_account().get_sentences_for_user(section=2))
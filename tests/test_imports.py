@@ -0,0 +1,77 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+from conftest import BASE_URL, TOKEN
+
+from pytorjoman import Section
+from pytorjoman.imports import _FuzzyIndex, import_translations
+
+
+def test_import_translations(server):
+    hello = server.add_sentence("Hello, world!")["id"]
+    bye = server.add_sentence("Good  bye")["id"]
+    server.add_translation(bye, "وداعا")
+    progress = []
+
+    async def main():
+        section = await Section.get_section(BASE_URL, TOKEN, 1)
+        return await import_translations(
+            section,
+            [
+                ("hello, WORLD!", "مرحبا بالعالم"),
+                ("good bye", "وداعا"),
+                ("unknown", "مجهول"),
+            ],
+            on_progress=progress.append,
+        )
+
+    report = asyncio.run(main())
+    assert [t.sentence.id for t in report.created] == [hello]
+    assert [s.id for s, _ in report.already_present] == [bye]
+    assert report.unmatched == [("unknown", "مجهول")]
+    assert sum(progress) == 3
+
+
+def test_fuzzy_index_finds_close_keys_among_many():
+    keys = [f"sentence number {n} of the corpus" for n in range(20000)]
+    index = _FuzzyIndex(keys, 0.9)
+    assert index.match("sentence number 12345 of the corpuss") == keys[12345]
+    assert index.match("something else entirely") is None
+
+
+def test_fuzzy_import_runs_off_the_loop(server):
+    close = server.add_sentence("The quick brown fox jumps")["id"]
+    match = _FuzzyIndex.match
+    ticks = []
+
+    def slow_match(self, key):
+        time.sleep(0.05)
+        return match(self, key)
+
+    async def tick():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def main():
+        section = await Section.get_section(BASE_URL, TOKEN, 1)
+        ticker = asyncio.create_task(tick())
+        try:
+            with patch.object(_FuzzyIndex, "match", slow_match):
+                return await import_translations(
+                    section,
+                    [("the quick brown fox jumped", "الثعلب"), ("other", "آخر")],
+                    fuzzy_cutoff=0.8,
+                )
+        finally:
+            ticker.cancel()
+
+    report = asyncio.run(main())
+    assert [(source, s.id) for source, s in report.fuzzy] == [
+        ("the quick brown fox jumped", close)
+    ]
+    assert [t.sentence.id for t in report.created] == [close]
+    assert report.unmatched == [("other", "آخر")]
+    # the loop kept running while the keys were being matched
+    assert len(ticks) > 10
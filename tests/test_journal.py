@@ -0,0 +1,137 @@
+import asyncio
+
+import httpx
+from conftest import BASE_URL, TOKEN
+
+from pytorjoman import Account, Section, Sentence
+from pytorjoman.journal import Journal
+
+
+def _account() -> Account:
+    return Account(
+        BASE_URL, "accounts", TOKEN, 1, "a", "b", "c", "d", None, 10, "refresh"
+    )
+
+
+def test_error_page_is_retried(server, tmp_path):
+    path = str(tmp_path / "journal")
+
+    def bad_gateway(request):
+        if request.method == "POST":
+            return httpx.Response(502, text="<html>Bad Gateway</html>")
+
+    async def main():
+        journal = Journal(path, _account())
+        section = await Section.get_section(BASE_URL, TOKEN, 1)
+        journal.create_sentence(section, "hello")
+        server.fault = bad_gateway
+        assert await journal.replay() == 0
+        assert len(journal) == 1 and not journal.failed
+        server.fault = None
+        assert await journal.replay() == 1
+        await journal.aclose()
+
+    asyncio.run(main())
+    assert [s["sentence"] for s in server.sentences.values()] == ["hello"]
+
+
+def test_replay_resumes_after_restart(server, tmp_path):
+    path = str(tmp_path / "journal")
+
+    async def first():
+        journal = Journal(path, _account())
+        section = await Section.get_section(BASE_URL, TOKEN, 1)
+        journal.create_sentence(section, "a")
+        journal.create_sentence(section, "b")
+        server.fault = lambda request: (
+            httpx.Response(503, json={})
+            if request.method == "POST" and b'"b"' in request.content
+            else None
+        )
+        assert await journal.replay() == 1
+        journal._journal.close()
+        journal._done_file.close()
+
+    async def second():
+        server.fault = None
+        journal = Journal(path, _account())
+        assert len(journal) == 1
+        assert await journal.replay() == 1
+        await journal.aclose()
+
+    asyncio.run(first())
+    asyncio.run(second())
+    assert sorted(s["sentence"] for s in server.sentences.values()) == ["a", "b"]
+    assert server.count("POST", "/api/v1/sentences/") == 3
+
+
+def test_sequence_numbers_survive_compaction(server, tmp_path):
+    path = str(tmp_path / "journal")
+
+    async def main():
+        journal = Journal(path, _account())
+        section = await Section.get_section(BASE_URL, TOKEN, 1)
+        first = journal.create_sentence(section, "a")
+        await journal.replay()
+        await journal.compact()
+        journal._journal.close()
+        journal._done_file.close()
+
+        restarted = Journal(path, _account())
+        assert len(restarted) == 0
+        assert restarted.create_sentence(section, "b") > first
+        assert await restarted.replay() == 1
+        await restarted.aclose()
+
+    asyncio.run(main())
+    assert sorted(s["sentence"] for s in server.sentences.values()) == ["a", "b"]
+
+
+def test_background_replay_survives_errors(server, tmp_path, monkeypatch):
+    calls = []
+
+    async def replay(self):
+        calls.append(None)
+        raise KeyError("boom")
+
+    async def main():
+        journal = Journal(str(tmp_path / "journal"), _account())
+        monkeypatch.setattr(Journal, "replay", replay)
+        journal.start(interval=0)
+        await asyncio.sleep(0.01)
+        assert not journal._task.done()
+        journal._task.cancel()
+
+    asyncio.run(main())
+    assert len(calls) > 1
+
+
+def test_update_is_replayed_after_restart(server, tmp_path):
+    path = str(tmp_path / "journal")
+    sentence = server.add_sentence("a")["id"]
+
+    async def first():
+        journal = Journal(path, _account())
+        section = await Section.get_section(BASE_URL, TOKEN, 1)
+        journal.update(
+            await Sentence.get_sentence(BASE_URL, TOKEN, sentence), new_sentence="b"
+        )
+        journal.update(section, new_name="renamed")
+        journal._journal.close()
+        journal._done_file.close()
+
+    async def second():
+        journal = Journal(path, _account())
+        assert len(journal) == 2
+        assert await journal.replay() == 2
+        assert not journal.failed
+        await journal.aclose()
+
+    asyncio.run(first())
+    asyncio.run(second())
+    assert server.sentences[sentence]["sentence"] == "b"
+    assert server.sections[1]["name"] == "renamed"
+    assert sorted(r.url.path for r in server.requests if r.method == "PUT") == [
+        "/api/v1/sections/update",
+        "/api/v1/sentences/update",
+    ]
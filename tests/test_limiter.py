@@ -0,0 +1,148 @@
+import asyncio
+
+import httpx
+import pytest
+from conftest import BASE_URL, TOKEN
+
+from pytorjoman import Project, _backend, configure
+from pytorjoman._backend import _AdaptiveLimiter, _gather_bounded, _Scheduler
+from pytorjoman.errors import UnknownError
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(_backend.time, "monotonic", clock)
+    return clock
+
+
+def _used(limiter: _AdaptiveLimiter, rtt: float, ok: bool = True) -> None:
+    limiter.observe(rtt, ok, int(limiter.limit))
+
+
+def test_limit_grows_while_latency_is_flat(clock):
+    limiter = _AdaptiveLimiter(100, initial=10)
+    for _ in range(10):
+        _used(limiter, 0.1)
+    # one per limit's worth of responses
+    assert 10.9 < limiter.limit < 11.1
+
+
+def test_limit_only_grows_when_used(clock):
+    limiter = _AdaptiveLimiter(100, initial=10)
+    for _ in range(50):
+        limiter.observe(0.1, True, 2)
+    assert limiter.limit == 10
+
+
+def test_limit_stays_within_bounds(clock):
+    limiter = _AdaptiveLimiter(12, minimum=2, initial=10)
+    for _ in range(100):
+        _used(limiter, 0.1)
+    assert limiter.limit == 12
+    for _ in range(100):
+        clock.now += 1
+        _used(limiter, 0.1, ok=False)
+    assert limiter.limit == 2
+
+
+def test_limit_shrinks_when_latency_rises(clock):
+    limiter = _AdaptiveLimiter(100, initial=10)
+    _used(limiter, 0.1)
+    clock.now += 1
+    _used(limiter, 1.0)
+    assert limiter.rtt > limiter.min_rtt * limiter.tolerance
+    assert limiter.limit < 10
+
+
+@pytest.mark.parametrize("status", [500, 503, 429])
+def test_limit_shrinks_on_errors(status):
+    configure(
+        adaptive=True,
+        transport=httpx.MockTransport(lambda request: httpx.Response(status, json={})),
+    )
+    with pytest.raises(UnknownError):
+        asyncio.run(Project.get_project(BASE_URL, TOKEN, 1))
+    [transport] = _backend._transports.values()
+    limiter = transport.scheduler.limiter
+    assert limiter.limit == 10 * limiter.backoff
+
+
+def test_limit_shrinks_at_most_once_per_rtt(clock):
+    limiter = _AdaptiveLimiter(100, initial=10)
+    limiter.observe(0.1, True, 0)
+    _used(limiter, 0.1, ok=False)
+    _used(limiter, 0.1, ok=False)
+    assert limiter.limit == 9
+    clock.now += 0.05
+    _used(limiter, 0.1, ok=False)
+    assert limiter.limit == 9
+    clock.now += 0.1
+    _used(limiter, 0.1, ok=False)
+    assert limiter.limit == pytest.approx(8.1)
+
+
+def test_min_rtt_follows_a_slower_server(clock):
+    limiter = _AdaptiveLimiter(100, initial=10)
+    _used(limiter, 0.1)
+    # the minimum of the previous window, which still saw 0.1, then this one's
+    for _ in range(2 * int(limiter.window) + 1):
+        clock.now += 1
+        _used(limiter, 1.0)
+    assert limiter.min_rtt == 1.0
+
+
+def test_growing_limit_admits_queued_requests():
+    async def main():
+        scheduler = _Scheduler(5, {"interactive": 1}, _AdaptiveLimiter(5, initial=1))
+        await scheduler.acquire("interactive")
+        waiters = [
+            asyncio.create_task(scheduler.acquire("interactive")) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.queued == 2
+        scheduler.observe(0.1, True)
+        await asyncio.sleep(0)
+        assert scheduler.slots == 2
+        assert scheduler.in_flight == 2
+        assert sum(waiter.done() for waiter in waiters) == 1
+        for waiter in waiters:
+            waiter.cancel()
+
+    asyncio.run(main())
+
+
+def test_adaptive_limit_backs_off_an_overloaded_server(server):
+    # serves 4 requests at a time, anything beyond that waits its turn
+    capacity = asyncio.Semaphore(4)
+    in_flight = peak = 0
+
+    async def handle(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            async with capacity:
+                await asyncio.sleep(0.002)
+            return server.handle(request)
+        finally:
+            in_flight -= 1
+
+    async def main():
+        await _gather_bounded(
+            (Project.get_project(BASE_URL, TOKEN, 1) for _ in range(400)), 64
+        )
+        return _backend.stats()
+
+    configure(max_connections=32, adaptive=True, transport=httpx.MockTransport(handle))
+    stats = asyncio.run(main())
+    assert stats["limit"] < 10
+    assert peak <= 32
@@ -0,0 +1,19 @@
+import subprocess
+import sys
+
+
+def test_star_import_exports_the_api():
+    namespace = {}
+    exec("from pytorjoman import *", namespace)
+    assert {"Account", "Project", "Section", "Sentence", "Translation"} <= set(
+        namespace
+    )
+    assert "importlib" not in namespace and "TYPE_CHECKING" not in namespace
+
+
+def test_import_is_lazy():
+    code = "import sys, pytorjoman; print('httpx' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,77 @@
+import asyncio
+
+import httpx
+import pytest
+from conftest import BASE_URL, TOKEN
+
+from pytorjoman import Sentence, configure
+from pytorjoman.errors import RequestBudgetExceededError
+from pytorjoman.profiling import Profile, endpoint
+
+
+def test_endpoint_template():
+    assert (
+        endpoint("GET", "http://host/api/v1/sections/12") == "GET /api/v1/sections/{id}"
+    )
+
+
+def test_get_many_fetches_shared_parents_once(server):
+    ids = [server.add_sentence(text)["id"] for text in "abcde"]
+
+    async def main():
+        with Profile(max_requests=len(ids) + 2, max_identical=1) as profile:
+            sentences = await Sentence.get_many(BASE_URL, TOKEN, ids)
+        assert [s.sentence for s in sentences] == list("abcde")
+        return profile
+
+    profile = asyncio.run(main())
+    assert profile.endpoints["GET /api/v1/sections/{id}"].calls == 1
+    assert profile.endpoints["GET /api/v1/projects/{id}"].calls == 1
+
+
+def test_budget_exceeded(server):
+    ids = [server.add_sentence(text)["id"] for text in "ab"]
+
+    async def main():
+        with Profile(max_identical=1):
+            for id in ids:
+                await Sentence.get_sentence(BASE_URL, TOKEN, id)
+
+    with pytest.raises(RequestBudgetExceededError, match="more than 1 times"):
+        asyncio.run(main())
+
+
+def test_failed_requests_are_recorded(server):
+    def refuse(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    server.fault = refuse
+
+    async def main():
+        with Profile() as profile:
+            with pytest.raises(httpx.ConnectError):
+                await Sentence.get_sentence(BASE_URL, TOKEN, 1)
+        return profile
+
+    stats = asyncio.run(main()).endpoints["GET /api/v1/sentences/{id}"]
+    assert stats.calls == 1
+    assert stats.statuses == {"ConnectError": 1}
+
+
+def test_queue_time_is_reported_separately(server):
+    server.delay = 0.05
+    configure(max_connections=1)
+
+    async def main():
+        with Profile() as profile:
+            await asyncio.gather(
+                *(Sentence._get_json(BASE_URL, 1) for _ in range(3)),
+                return_exceptions=True,
+            )
+        return profile
+
+    stats = asyncio.run(main()).endpoints["GET /api/v1/sentences/{id}"]
+    assert stats.calls == 3
+    # each request takes about 50ms once sent, the later ones waited for a slot
+    assert stats.total_time < 0.25
+    assert stats.queue_time >= 0.12
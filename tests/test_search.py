@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+from conftest import BASE_URL, TOKEN
+
+from pytorjoman import Section, Sentence, Translation
+from pytorjoman._backend import ModelList
+from pytorjoman.search import SearchIndex, normalize, tokenize
+
+
+def _sentence(id: int, text: str) -> Sentence:
+    return Sentence(BASE_URL, "sentences", TOKEN, id, None, text, None)
+
+
+def _translation(id: int, text: str) -> Translation:
+    return Translation(
+        BASE_URL, "translations", TOKEN, id, None, None, text, [], False, None
+    )
+
+
+@pytest.fixture
+def index() -> SearchIndex:
+    index = SearchIndex()
+    index.add(
+        ModelList(
+            2,
+            None,
+            None,
+            [
+                _sentence(1, "The quick brown fox"),
+                _sentence(2, "A brown quick dog, quickly"),
+            ],
+        ),
+        [_translation(1, "الثعلبُ البنيّ السريع"), _translation(2, "مدرسة على التلّ")],
+    )
+    return index
+
+
+@pytest.mark.parametrize(
+    "text, folded",
+    [
+        ("أَحْمَد", "احمد"),
+        ("إسلام", "اسلام"),
+        ("آمن", "امن"),
+        ("مؤمن", "مومن"),
+        ("سائل", "سايل"),
+        ("مـــرحبا", "مرحبا"),
+        ("مدرسة", "مدرسه"),
+        ("على", "علي"),
+        ("ٱلله", "الله"),
+        ("Café CRÈME", "cafe creme"),
+    ],
+)
+def test_normalize(text, folded):
+    assert normalize(text) == folded
+
+
+def test_tokenize():
+    assert tokenize("Hello, WORLD! مرحبًا") == ["hello", "world", "مرحبا"]
+
+
+def test_words_must_all_match(index):
+    assert index.search("brown quick") == [("sentence", 1), ("sentence", 2)]
+    assert index.search("fox brown") == [("sentence", 1)]
+    assert index.search("fox dog") == []
+
+
+def test_arabic_queries_are_folded(index):
+    assert index.search("الثعلب") == [("translation", 1)]
+    assert index.search("مدرسه علي") == [("translation", 2)]
+    assert index.search("التل", kind="sentence") == []
+
+
+def test_phrases_match_in_order(index):
+    assert index.search('"quick brown"') == [("sentence", 1)]
+    assert index.search('"brown quick"') == [("sentence", 2)]
+    assert index.search('"brown dog"') == []
+    assert index.search('"البني السريع"') == [("translation", 1)]
+
+
+def test_prefixes(index):
+    assert index.search("quick*") == [("sentence", 1), ("sentence", 2)]
+    assert index.search("quickl*") == [("sentence", 2)]
+    assert index.search("ال*", kind="translation") == [
+        ("translation", 1),
+        ("translation", 2),
+    ]
+    assert index.search("zz*") == []
+
+
+def test_re_adding_replaces_the_text(index):
+    index.add(_sentence(1, "A slow red fox"))
+    assert index.search("quick") == [("sentence", 2)]
+    assert index.search("red fox") == [("sentence", 1)]
+    assert "brown" in index.postings
+    index.remove(_sentence(2, ""))
+    assert "brown" not in index.postings
+    assert index.search("quick*") == []
+    assert len(index) == 3
+
+
+def test_save_and_load(index, tmp_path):
+    # positions and ids large enough to need several varint bytes
+    index.add(_sentence(100_000, " ".join(["pad"] * 300 + ["needle"])))
+    path = str(tmp_path / "index")
+    index.save(path)
+    loaded = SearchIndex.load(path)
+    assert loaded.postings == index.postings
+    assert len(loaded) == len(index)
+    assert loaded.search('"pad needle"') == [("sentence", 100_000)]
+    loaded.add(_sentence(100_000, "gone"))
+    assert loaded.search("needle") == []
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "other"
+    path.write_bytes(b"not an index")
+    with pytest.raises(ValueError):
+        SearchIndex.load(str(path))
+
+
+def test_crawl(server):
+    sentence = server.add_sentence("Hello world")["id"]
+    translation = server.add_translation(sentence, "مرحبا بالعالم")["id"]
+
+    async def main():
+        index = SearchIndex()
+        await index.crawl(await Section.get_section(BASE_URL, TOKEN, 1))
+        return index
+
+    index = asyncio.run(main())
+    assert index.search("hello") == [("sentence", sentence)]
+    assert index.search("مرحبا") == [("translation", translation)]
@@ -0,0 +1,78 @@
+import asyncio
+
+from conftest import BASE_URL, TOKEN
+
+from pytorjoman import Section, Sentence
+
+
+def _sync(sentences: list[str]):
+    async def main():
+        section = await Section.get_section(BASE_URL, TOKEN, 1)
+        return await section.sync_from(sentences, page_size=2)
+
+    return asyncio.run(main())
+
+
+def test_sync_from_issues_only_the_changes(server):
+    for text in ["a", "b", "c", "d", "e"]:
+        server.add_sentence(text)
+    server.requests.clear()
+    report = _sync(["a", "B", "c", "e", "f"])
+    assert report.unchanged == 3
+    assert [s.sentence for s in report.updated] == ["B"]
+    assert [s.sentence for s in report.created] == ["f"]
+    assert [s.sentence for s in report.removed] == ["d"]
+    assert not report.failed
+    assert server.count("POST", "/api/v1/sentences/") == 1
+    assert [r.url.path for r in server.requests if r.method == "PUT"] == [
+        "/api/v1/sentences/update"
+    ]
+    assert [s["sentence"] for s in server.sentences.values()] == list("aBcdef")
+
+
+def test_sync_from_is_idempotent(server):
+    for text in ["a", "b", "c"]:
+        server.add_sentence(text)
+    first = _sync(["a", "x", "b", "c"])
+    assert [s.sentence for s in first.created] == ["x"]
+    # "x" now has the highest id and is listed last
+    second = _sync(["a", "x", "b", "c"])
+    assert second.unchanged == 4
+    assert not (second.created or second.updated or second.removed or second.failed)
+
+
+def test_sync_from_reports_progress(server):
+    for text in ["a", "b", "c"]:
+        server.add_sentence(text)
+    progress = []
+
+    async def main():
+        section = await Section.get_section(BASE_URL, TOKEN, 1)
+        return await section.sync_from(
+            ["a", "B", "c", "d"], page_size=2, on_progress=progress.append
+        )
+
+    asyncio.run(main())
+    assert progress[0] == 2
+    assert sum(progress) == 4
+
+
+def test_fetched_models_call_their_own_endpoints(server):
+    sentence = server.add_sentence("a")["id"]
+
+    async def main():
+        section = await Section.get_section(BASE_URL, TOKEN, 1)
+        await section.update("renamed")
+        fetched = await Sentence.get_sentence(BASE_URL, TOKEN, sentence)
+        await fetched.update("b")
+        [many] = await Sentence.get_many(BASE_URL, TOKEN, [sentence])
+        await many.update("c")
+
+    asyncio.run(main())
+    assert [r.url.path for r in server.requests if r.method == "PUT"] == [
+        "/api/v1/sections/update",
+        "/api/v1/sentences/update",
+        "/api/v1/sentences/update",
+    ]
+    assert server.sections[1]["name"] == "renamed"
+    assert server.sentences[sentence]["sentence"] == "c"
@@ -0,0 +1,82 @@
+import asyncio
+import math
+import os
+
+import pytest
+from conftest import BASE_URL, TOKEN
+
+from pytorjoman import Project
+from pytorjoman.snapshots import Snapshot
+
+
+@pytest.fixture
+def project(server):
+    server.sections[2] = {
+        "id": 2,
+        "project": 1,
+        "name": "empty",
+        "created_at": "2023-01-02T00:00:00Z",
+    }
+    a, b, c = (server.add_sentence(text)["id"] for text in ["a", "b", "ج"])
+    server.add_translation(a, "أ")["is_approved"] = True
+    server.add_translation(a, "ا")
+    server.add_translation(b, "ب")["translator"] = None
+    return server
+
+
+def _build(**kwargs) -> Snapshot:
+    async def main():
+        project = await Project.get_project(BASE_URL, TOKEN, 1)
+        return await project.snapshot(page_size=2, **kwargs)
+
+    return asyncio.run(main())
+
+
+def test_build(project):
+    snapshot = _build()
+    assert list(snapshot.sections["id"]) == [1, 2]
+    assert list(snapshot.sections.text) == ["section", "empty"]
+    assert list(snapshot.sentences.text) == ["a", "b", "ج"]
+    assert list(snapshot.translations.text) == ["أ", "ا", "ب"]
+    assert snapshot.approval_by_section() == {1: 1 / 3, 2: 0.0}
+    assert snapshot.translations_per_translator() == {1: 2, -1: 1}
+
+
+def test_build_reports_progress(project):
+    progress = []
+    snapshot = _build(on_progress=progress.append)
+    assert sum(progress) == len(snapshot.sentences) + len(snapshot.translations)
+
+
+def test_save_and_load(project, tmp_path):
+    snapshot = _build()
+    snapshot.save(str(tmp_path))
+    loaded = Snapshot.load(str(tmp_path))
+    assert loaded.project_id == 1
+    for name in ["sections", "sentences", "translations"]:
+        table, copy = getattr(snapshot, name), getattr(loaded, name)
+        assert len(copy) == len(table)
+        for column, values in table.columns.items():
+            assert list(copy[column]) == list(values)
+        assert list(copy.text) == list(table.text)
+    # mapped, not read into memory
+    assert isinstance(loaded.sentences["id"], memoryview)
+    assert loaded.sections["created_at"][0] == snapshot.sections["created_at"][0]
+    assert loaded.approval_by_section() == snapshot.approval_by_section()
+    assert loaded.translations_per_translator() == {1: 2, -1: 1}
+
+
+def test_save_and_load_empty_tables(server, tmp_path):
+    # a project with one section holding no sentences
+    snapshot = _build()
+    assert len(snapshot.sentences) == len(snapshot.translations) == 0
+    snapshot.save(str(tmp_path))
+    assert os.path.getsize(tmp_path / "translations.id") == 0
+    loaded = Snapshot.load(str(tmp_path))
+    assert len(loaded.translations) == 0
+    assert list(loaded.translations.text) == []
+    assert list(loaded.sentences.text) == []
+    assert loaded.approval_by_section() == {1: 0.0}
+    assert not loaded.translations_per_translator()
+    assert list(loaded.sections.text) == ["section"]
+    assert not math.isnan(loaded.sections["created_at"][0])
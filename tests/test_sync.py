@@ -0,0 +1,37 @@
+import pytest
+from conftest import BASE_URL, TOKEN
+
+from pytorjoman import sync
+
+
+@pytest.fixture
+def runner(server):
+    yield server
+    sync.shutdown()
+
+
+def test_facade_returns_facades(runner):
+    runner.add_sentence("a")
+    section = sync.Section.get_section(BASE_URL, TOKEN, 1)
+    assert isinstance(section, sync.Section)
+    assert isinstance(section.project, sync.Project)
+    page = section.list_sentences()
+    assert [s.sentence for s in page.results] == ["a"]
+    assert isinstance(page.results[0], sync.Sentence)
+
+
+def test_reports_hold_facades(runner):
+    runner.add_sentence("a")
+    section = sync.Section.get_section(BASE_URL, TOKEN, 1)
+    report = section.sync_from(["b", "c"])
+    assert isinstance(report.updated[0], sync.Sentence)
+    assert isinstance(report.created[0], sync.Sentence)
+    report.updated[0].update("d")
+    assert [s["sentence"] for s in runner.sentences.values()] == ["d", "c"]
+
+
+def test_batch(runner):
+    section = sync.Section.get_section(BASE_URL, TOKEN, 1)
+    created = sync.batch(section.create_sentence, ["a", "b", "c"])
+    assert [s.sentence for s in created] == ["a", "b", "c"]
+    assert all(isinstance(s, sync.Sentence) for s in created)
@@ -0,0 +1,86 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from conftest import BASE_URL, TOKEN
+
+from pytorjoman import Section
+from pytorjoman.validation import (
+    DEFAULT_CHECKS,
+    Duplicates,
+    bidi_controls,
+    numbers,
+    placeholders,
+    submit_translations,
+)
+
+
+def test_checks():
+    assert placeholders("Hello {name}, %s", "مرحبا {name} %s") is None
+    assert "missing ['%s']" in placeholders("Hello {name}, %s", "مرحبا {name}")
+    assert placeholders("Get 50% discount today", "احصل على خصم 50٪ اليوم") is None
+    assert placeholders("100% sure", "متأكد 100٪") is None
+    assert placeholders("%-5d of %(total)s", "%-5d من %(total)s") is None
+    assert numbers("3 items", "٣ عناصر") is None
+    assert numbers("3 items", "4 عناصر") is not None
+    assert bidi_controls("", "a\u2067b\u2069") is None
+    assert bidi_controls("", "a\u2067b") is not None
+
+
+def test_duplicates_are_per_sentence():
+    check = Duplicates({1: {"OK"}})
+    assert check("Okay", "ok", 1) is not None
+    assert check("Fine", "OK", 2) is None
+
+
+def _submit(server, items, checks, **kwargs):
+    async def main():
+        section = await Section.get_section(BASE_URL, TOKEN, 1)
+        sentences = {
+            s.sentence: s for s in (await section.list_sentences(1, 100)).results
+        }
+        return [
+            result
+            async for result in submit_translations(
+                [(sentences[source], text) for source, text in items],
+                checks,
+                batch_size=2,
+                **kwargs,
+            )
+        ]
+
+    return asyncio.run(main())
+
+
+def _setup(server):
+    okay = server.add_sentence("Okay")["id"]
+    server.add_sentence("Fine")
+    server.add_sentence("3 items")
+    server.add_translation(okay, "OK")
+    return Duplicates({okay: {"OK"}})
+
+
+def test_submit_translations_in_process_pool(server):
+    duplicates = _setup(server)
+    results = _submit(
+        server,
+        [("Okay", "OK"), ("Fine", "OK"), ("3 items", "4 عناصر")],
+        DEFAULT_CHECKS + (duplicates,),
+        processes=2,
+    )
+    by_source = {r.sentence.sentence: r for r in results}
+    assert by_source["Okay"].problems == ["duplicate of an existing translation"]
+    assert by_source["Fine"].created.translation == "OK"
+    assert by_source["3 items"].problems and by_source["3 items"].created is None
+    assert server.count("POST", "/api/v1/translations/") == 1
+
+
+def test_submit_translations_with_given_executor(server):
+    duplicates = _setup(server)
+    with ThreadPoolExecutor(2) as executor:
+        results = _submit(
+            server,
+            [("Okay", "OK"), ("Fine", "OK")],
+            (duplicates,),
+            executor=executor,
+        )
+    assert sorted(bool(r.problems) for r in results) == [False, True]